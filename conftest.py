@@ -2,6 +2,7 @@
 # Part of Red Queen Project.  This file is distributed under the MIT License.
 # See accompanying file /LICENSE for details.
 # ------------------------------------------------------------------------------
+import argparse
 import os
 import pathlib
 
@@ -21,6 +22,13 @@ def parse_num_pawns(string):
         return 1
 
 
+def parse_thread_counts(string):
+    thread_counts = sorted({int(threads) for threads in string.split(",")})
+    if thread_counts[0] < 1:
+        raise argparse.ArgumentTypeError("thread counts must be positive")
+    return thread_counts
+
+
 def pytest_addoption(parser):
     group = parser.getgroup("red_queen", "Red Queen multiprocess benchmarking")
     group._addoption(
@@ -40,6 +48,64 @@ def pytest_addoption(parser):
         type=pathlib.Path,
         help="",
     )
+    group.addoption(
+        "--schedule",
+        default="random",
+        choices=["random", "affinity"],
+        dest="schedule",
+        help="'random' shuffles the tests among pawns, 'affinity' sends tests sharing "
+        "an input (e.g. the same qasm file and device) to the same pawn in sequence",
+    )
+    group.addoption(
+        "--time_parse",
+        action="store_true",
+        default=False,
+        dest="time_parse",
+        help="also time parsing each benchmark's input, bypassing the circuit cache",
+    )
+    group.addoption(
+        "--fidelity",
+        default="sampled",
+        choices=["sampled", "estimated"],
+        dest="fidelity",
+        help="'sampled' simulates application circuits with noise to measure their fidelity, "
+        "'estimated' skips the simulation and estimates their success probability from "
+        "the backend's calibration data (always done for circuits on more than 8 qubits)",
+    )
+    group.addoption(
+        "--quality_phase",
+        action="store_true",
+        default=False,
+        dest="quality_phase",
+        help="defer slow quality measurements (e.g. noisy simulations) until every "
+        "benchmark has been timed, and run them in a separate worker pool",
+    )
+    group.addoption(
+        "--seeds",
+        default=0,
+        dest="seeds",
+        metavar="K",
+        type=int,
+        help="run every benchmark taking a 'seed' over K seeds, as separate jobs, and "
+        "store the distribution of their results",
+    )
+    group.addoption(
+        "--cold",
+        action="store_true",
+        default=False,
+        dest="cold",
+        help="run every benchmark in a freshly spawned pawn, so that its first call is "
+        "timed cold, i.e. with its modules imported but nothing else warmed up",
+    )
+    group.addoption(
+        "--thread_scaling",
+        default=None,
+        dest="thread_scaling",
+        metavar="1,2,4",
+        type=parse_thread_counts,
+        help="run the benchmarks once per thread count, with every pawn limited to that "
+        "many threads on cores of its own, and store their speedup and efficiency",
+    )
     group.addoption(
         "--store",
         action="store_true",
@@ -58,9 +124,35 @@ def pytest_configure(config):
         config.pluginmanager.register(RedQueen(config), "red_queen")
 
 
+def pytest_generate_tests(metafunc):
+    num_seeds = metafunc.config.getoption("seeds")
+    if num_seeds and "seed" in metafunc.fixturenames:
+        metafunc.parametrize("seed", range(num_seeds), ids=lambda seed: f"seed{seed}")
+
+
+@pytest.fixture(scope="function")
+def seed():
+    """The seed of stochastic tools, None means their usual fixed seed."""
+    return None
+
+
 @pytest.fixture(scope="function")
 def benchmark(request):
-    fixture = BenchmarkFixture(request.node)
+    fixture = BenchmarkFixture(
+        request.node,
+        request.config.getoption("time_parse"),
+        request.config.getoption("fidelity"),
+        request.config.getoption("quality_phase"),
+    )
+    if "seed" in request.fixturenames and request.getfixturevalue("seed") is not None:
+        fixture.info.parameters["seed"] = request.getfixturevalue("seed")
+    if getattr(request.config.option, "threads", None) is not None:
+        fixture.info.parameters["threads"] = request.config.option.threads
     yield fixture
+    # Skipped (e.g. too wide for the backend) or failed before being timed
+    if not fixture.info._time_data:  # pylint: disable=protected-access
+        return
     pawn = request.config.pluginmanager.getplugin("pawn")
-    pawn.send_report("benchmark_info", info=fixture.info.as_dict())
+    pawn.send_report(
+        "benchmark_info", info=fixture.info.as_dict(), deferred=fixture.info.deferred_payload()
+    )
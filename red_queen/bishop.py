@@ -5,21 +5,64 @@
 
 """Bishop for storing benchmark results."""
 
+import hashlib
 import json
+import os
 import platform
+import statistics
+import subprocess
 import tempfile
+import threading
+from collections import defaultdict
+from importlib import metadata
 from pathlib import Path
 import shutil
 
 import cpuinfo
+from red_queen.cache import atomic_write, cache_dir
+from red_queen.pawn import THREAD_VARIABLES
+
+# Distributions whose versions decide whether two sessions can be compared.
+_TRACKED_PACKAGES = [
+    "qiskit",
+    "qiskit-terra",
+    "qiskit-aer",
+    "pytket",
+    "tweedledum",
+    "numpy",
+    "rustworkx",
+    "retworkx",
+]
 
 
 class Bishop:
     """The Bishop is responsible for storing the results on a file."""
 
+    @staticmethod
+    def _get_boot_id():
+        try:
+            return Path("/proc/sys/kernel/random/boot_id").read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+
     @staticmethod
     def _get_cpu_info():
-        return cpuinfo.get_cpu_info() or {}
+        """Returns the CPU information, cached on disk for the current boot.
+
+        Probing the CPU may spawn subprocesses and take over a second, while the
+        answer only changes if the machine reboots.
+        """
+        boot_id = Bishop._get_boot_id()
+        if boot_id is None:
+            return cpuinfo.get_cpu_info() or {}
+        path = cache_dir("machine_info") / f"{platform.node()}_{boot_id}.json"
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+        info = cpuinfo.get_cpu_info() or {}
+        atomic_write(path, json.dumps(info).encode("utf-8"))
+        return info
 
     @staticmethod
     def _get_machine_info():
@@ -36,6 +79,71 @@ class Bishop:
             "cpu": Bishop._get_cpu_info(),
         }
 
+    @staticmethod
+    def _get_package_versions():
+        versions = {}
+        for package in _TRACKED_PACKAGES:
+            try:
+                versions[package] = metadata.version(package)
+            except metadata.PackageNotFoundError:
+                versions[package] = None
+        return versions
+
+    @staticmethod
+    def _get_cpu_governors():
+        paths = Path("/sys/devices/system/cpu").glob("cpu[0-9]*/cpufreq/scaling_governor")
+        governors = set()
+        for path in paths:
+            try:
+                governors.add(path.read_text(encoding="utf-8").strip())
+            except OSError:
+                continue
+        return sorted(governors)
+
+    @staticmethod
+    def _get_git_commit():
+        root = Path(__file__).parent
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=root,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.strip()
+            status = subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=no"],
+                cwd=root,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return {"commit": None, "dirty": None}
+        return {"commit": commit, "dirty": bool(status)}
+
+    @staticmethod
+    def _get_environment_info(machine_info):
+        """Returns the environment fingerprint of this session.
+
+        Everything but the red_queen commit takes part in the ``fingerprint``
+        hash: timings are only comparable between sessions with equal hashes.
+        """
+        environment = {
+            "packages": Bishop._get_package_versions(),
+            "threads": {name: os.environ.get(name) for name in THREAD_VARIABLES},
+            "cpu_governor": Bishop._get_cpu_governors(),
+            "cpu": machine_info["cpu"].get("brand_raw"),
+            "machine": machine_info["machine"],
+            "system": machine_info["system"],
+            "python_implementation": machine_info["python_implementation"],
+            "python_version": machine_info["python_version"],
+        }
+        digest = hashlib.sha256(json.dumps(environment, sort_keys=True).encode("utf-8"))
+        environment["fingerprint"] = digest.hexdigest()
+        environment["red_queen"] = Bishop._get_git_commit()
+        return environment
+
     def _next_id(self):
         root = Path(self.storage_dir).resolve()
         paths = list(root.glob("[0-9][0-9][0-9][0-9]_*.json"))
@@ -48,15 +156,147 @@ class Bishop:
         self.store_data = config.option.store_data
         self.storage_dir = config.option.storage_dir
         self.report = {}
-        self.report["machine_info"] = self._get_machine_info()
+        self.report["machine_info"] = None
+        self.report["environment"] = None
         self.report["benchmarks"] = []
+        self.report["import_times"] = {}
+        # Probing the machine must not block the session start, so it happens
+        # while the pawns are collecting tests.
+        self._machine_probe = threading.Thread(target=self._probe_machine, daemon=True)
+        self._machine_probe.start()
+
+    def _probe_machine(self):
+        machine_info = self._get_machine_info()
+        self.report["environment"] = self._get_environment_info(machine_info)
+        self.report["machine_info"] = machine_info
 
     def add_benchmark_info(self, benchmark_info):
+        """Records a benchmark's results and returns its index in the report."""
         self.report["benchmarks"].append(benchmark_info)
+        return len(self.report["benchmarks"]) - 1
+
+    def add_quality(self, index, stats, error=None):
+        """Merges quality stats computed after timing into a recorded benchmark.
+
+        The stats a failed computation didn't return keep their None value.
+        """
+        benchmark = self.report["benchmarks"][index]
+        benchmark["stats"]["quality"].update(stats)
+        if error is not None:
+            benchmark["quality_error"] = error
+
+    def add_import_times(self, pawn_uid, collection, imports):
+        """Records how long a pawn spent collecting test modules and importing tools."""
+        self.report["import_times"][f"pawn-{pawn_uid}"] = {
+            "collection": collection,
+            "imports": imports,
+        }
+
+    @staticmethod
+    def _distribution(values):
+        values = sorted(values)
+        if len(values) > 1:
+            p25, _, p75 = statistics.quantiles(values, n=4, method="inclusive")
+        else:
+            p25 = p75 = values[0]
+        return {
+            "median": statistics.median(values),
+            "min": values[0],
+            "max": values[-1],
+            "p25": p25,
+            "p75": p75,
+        }
+
+    def _ensembles(self):
+        """Aggregates the results of benchmarks run over several seeds.
+
+        Runs of the same benchmark differ only by the ``seed`` parameter.  Each
+        ensemble holds the distribution of the mean time and of every quality
+        metric over its valid seeds, and the number of invalid ones left out.
+        The timing is None if no seed is valid.
+        """
+        runs = defaultdict(list)
+        for benchmark in self.report["benchmarks"]:
+            parameters = dict(benchmark.get("parameters", {}))
+            if parameters.pop("seed", None) is None:
+                continue
+            key = (benchmark["name"], benchmark["tool"], benchmark["algorithm"])
+            runs[key + (json.dumps(parameters, sort_keys=True),)].append(benchmark)
+
+        ensembles = []
+        for (name, tool, algorithm, parameters), benchmarks in runs.items():
+            valid = [benchmark for benchmark in benchmarks if benchmark.get("valid", True)]
+            quality = defaultdict(list)
+            for benchmark in valid:
+                for metric, value in benchmark["stats"]["quality"].items():
+                    if value is not None:
+                        quality[metric].append(value)
+            timing = [benchmark["stats"]["timing"]["mean"] for benchmark in valid]
+            ensembles.append(
+                {
+                    "name": name,
+                    "tool": tool,
+                    "algorithm": algorithm,
+                    "parameters": json.loads(parameters),
+                    "seeds": sorted(benchmark["parameters"]["seed"] for benchmark in benchmarks),
+                    "invalid": len(benchmarks) - len(valid),
+                    "timing": self._distribution(timing) if timing else None,
+                    "quality": {
+                        metric: self._distribution(values) for metric, values in quality.items()
+                    },
+                }
+            )
+        return ensembles
+
+    def _thread_scaling(self):
+        """Computes the speedup and efficiency curves of thread scaling passes.
+
+        Every pass runs the same tests, so runs of a benchmark share their id.  The
+        speedup is relative to the run with the fewest threads, and the
+        efficiency is the speedup divided by the relative number of threads.
+        """
+        runs = defaultdict(dict)
+        for benchmark in self.report["benchmarks"]:
+            threads = benchmark.get("parameters", {}).get("threads")
+            if threads is None:
+                continue
+            runs[benchmark["id"]][threads] = benchmark
+
+        curves = []
+        for benchmark_id, benchmarks in runs.items():
+            threads = sorted(benchmarks)
+            means = [benchmarks[count]["stats"]["timing"]["mean"] for count in threads]
+            speedup = [means[0] / mean for mean in means]
+            first = benchmarks[threads[0]]
+            parameters = dict(first["parameters"])
+            del parameters["threads"]
+            curves.append(
+                {
+                    "id": benchmark_id,
+                    "name": first["name"],
+                    "tool": first["tool"],
+                    "algorithm": first["algorithm"],
+                    "parameters": parameters,
+                    "threads": threads,
+                    "mean": means,
+                    "speedup": speedup,
+                    "efficiency": [
+                        value * threads[0] / count for value, count in zip(speedup, threads)
+                    ],
+                }
+            )
+        return curves
 
     def store(self):
         if not self.report["benchmarks"]:
             return
+        self._machine_probe.join()
+        ensembles = self._ensembles()
+        if ensembles:
+            self.report["ensembles"] = ensembles
+        thread_scaling = self._thread_scaling()
+        if thread_scaling:
+            self.report["thread_scaling"] = thread_scaling
 
         tmpfd, tmppath = tempfile.mkstemp(prefix="RedQueen_", text=True)
         with open(tmpfd, "w", encoding="utf-8") as outfile:
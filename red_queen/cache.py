@@ -0,0 +1,145 @@
+# ------------------------------------------------------------------------------
+# Part of Qiskit.  This file is distributed under the Apache 2.0 License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""On-disk caches shared by all pawns and sessions."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+
+def cache_dir(*parts) -> Path:
+    """Returns (and creates) a directory inside the Red Queen cache.
+
+    The cache lives in ``$RED_QUEEN_CACHE_DIR`` if set, otherwise in
+    ``$XDG_CACHE_HOME/red_queen`` (``~/.cache/red_queen`` by default).
+    """
+    root = os.environ.get("RED_QUEEN_CACHE_DIR")
+    if root is None:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        root = Path(xdg_cache) / "red_queen"
+    path = Path(root).joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Writes ``data`` to ``path`` such that readers never see a partial file.
+
+    Several pawns may race to fill the same entry, the last one wins.
+    """
+    tmpfd, tmppath = tempfile.mkstemp(dir=path.parent, prefix=".tmp_")
+    try:
+        with open(tmpfd, "wb") as outfile:
+            outfile.write(data)
+        os.replace(tmppath, path)
+    except BaseException:
+        Path(tmppath).unlink(missing_ok=True)
+        raise
+
+
+def file_digest(path) -> str:
+    """Returns the sha256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as infile:
+        for chunk in iter(lambda: infile.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """A size-bounded key-value store of bytes kept in the Red Queen cache.
+
+    Entries are files named after their key.  Reading an entry refreshes its
+    modification time, and once a namespace grows over ``max_bytes`` the least
+    recently used entries are evicted.  The bound defaults to
+    ``$RED_QUEEN_CACHE_BYTES``, or 1 GiB.
+    """
+
+    def __init__(self, *namespace, max_bytes=None):
+        self.path = cache_dir(*namespace)
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("RED_QUEEN_CACHE_BYTES", 1 << 30))
+        self.max_bytes = max_bytes
+
+    def get(self, key):
+        path = self.path / key
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def get_path(self, key):
+        """Returns the path of an entry, or None if it is not cached."""
+        path = self.path / key
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key, data: bytes):
+        """Stores an entry and returns its path."""
+        atomic_write(self.path / key, data)
+        self._evict()
+        return self.path / key
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.name.startswith(".tmp_"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            Path(path).unlink(missing_ok=True)
+            total -= size
+
+
+# Parsed files recently used by this process, most recent last.
+_parsed = OrderedDict()
+_PARSED_SIZE = 8
+
+
+def cached_parse(path, cache, parse, dumps, loads):
+    """Parses a file, reusing earlier results for the same content.
+
+    Results are looked up first in this process, then in ``cache``, which is
+    shared by all pawns and sessions.  Only when both miss the file is parsed
+    with ``parse(str(path))``.  ``dumps`` and ``loads`` convert between the parsed
+    object and bytes; if ``dumps`` fails with a ``TypeError`` (e.g. an object
+    that can't be pickled), the result is only kept in this process.
+
+    The returned object is shared, callers must not modify it.
+    """
+    key = (str(cache.path), file_digest(path))
+    if key in _parsed:
+        _parsed.move_to_end(key)
+        return _parsed[key]
+    data = cache.get(key[1])
+    if data is not None:
+        parsed = loads(data)
+    else:
+        parsed = parse(str(path))
+        try:
+            cache.put(key[1], dumps(parsed))
+        except (TypeError, pickle.PicklingError):
+            pass
+    _parsed[key] = parsed
+    if len(_parsed) > _PARSED_SIZE:
+        _parsed.popitem(last=False)
+    return parsed
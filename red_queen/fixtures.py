@@ -8,12 +8,65 @@
 
 import sys
 import gc
+import pickle
 import statistics
+import traceback
 
+from collections import defaultdict
 from functools import cached_property
 from math import ceil
 from timeit import default_timer
 
+# Benchmarks run by this process so far: only the first one is timed cold.
+_num_benchmarks = 0
+
+
+def _read_status(field):
+    with open("/proc/self/status", encoding="ascii") as status:
+        for line in status:
+            if line.startswith(field):
+                return int(line.split()[1]) * 1024
+    return None
+
+
+def _start_memory_tracking():
+    """Resets the peak resident set size of this process and returns the current one.
+
+    Returns None if the platform can't track the peak (only Linux can).
+    """
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as clear_refs:
+            clear_refs.write("5")
+        return _read_status("VmRSS:")
+    except OSError:
+        return None
+
+
+def _peak_memory(baseline):
+    """Returns how much the resident set size grew at its peak since `baseline`."""
+    if baseline is None:
+        return None
+    return _read_status("VmHWM:") - baseline
+
+
+def run_deferred_quality(sys_path, tasks):
+    """Runs the quality functions a benchmark deferred, and merges their stats.
+
+    ``tasks`` is the pickled list of ``(function, args, kwargs)``; ``sys_path`` is
+    the module search path of the pawn that deferred them, needed to import the
+    functions.  Returns the stats and, if a function failed, its traceback.
+    """
+    for path in reversed(sys_path):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    stats = {}
+    try:
+        for function, args, kwargs in pickle.loads(tasks):
+            stats.update(function(*args, **kwargs))
+    except Exception:  # pylint: disable=broad-except
+        return stats, traceback.format_exc()
+    return stats, None
+
 
 class BenchmarkInfo:
     """Benchmark information."""
@@ -31,21 +84,52 @@ class BenchmarkInfo:
         self.algorithm = "default"
         self._time_data = []
         self.quality_stats = {}
+        self.peak_memory = None
+        # Size of the benchmark's input and the device it targets, e.g.
+        # {"gates": 120, "qubits": 5, "device": "FakeMontreal"}
+        self.size = {}
+        self.first_call = None
+        self.cold = False
+        self.valid = True
+        self.parameters = {}
+        self.deferred_quality = []
+        self._phase_data = defaultdict(list)
 
     def update(self, duration):
         self._time_data.append(duration)
 
+    def deferred_payload(self):
+        """Returns what a quality worker needs to run the deferred quality functions."""
+        if not self.deferred_quality:
+            return None
+        return list(sys.path), pickle.dumps(self.deferred_quality)
+
+    def update_phase(self, phase, duration):
+        """Records how long one call spent in a phase (e.g. layout or routing)."""
+        self._phase_data[phase].append(duration)
+
     def as_dict(self):
         result = {
             "id": self._id,
             "name": self.name,
             "tool": self.tool,
             "algorithm": self.algorithm,
+            "valid": self.valid,
+            "parameters": self.parameters,
+            "size": self.size,
             "stats": {
                 "timing": dict((field, getattr(self, field)) for field in self._fields()),
                 "quality": self.quality_stats,
             },
         }
+        if self.first_call is not None:
+            result["stats"]["latency"] = {"first_call": self.first_call, "cold": self.cold}
+        if self.peak_memory is not None:
+            result["stats"]["memory"] = {"peak": self.peak_memory}
+        if self._phase_data:
+            result["stats"]["phases"] = {
+                phase: statistics.mean(durations) for phase, durations in self._phase_data.items()
+            }
         return result
 
     @staticmethod
@@ -72,8 +156,11 @@ class BenchmarkInfo:
 class BenchmarkFixture:
     """Benchmark fixture."""
 
-    def __init__(self, node):
+    def __init__(self, node, time_parse=False, fidelity="sampled", quality_phase=False):
         self.info = BenchmarkInfo(node)
+        self.time_parse = time_parse
+        self.fidelity = fidelity
+        self.quality_phase = quality_phase
         # TODO: make configurable
         self._disable_gc = True
         self._min_time = 5e-06
@@ -95,6 +182,28 @@ class BenchmarkFixture:
     def algorithm(self, value):
         self.info.algorithm = value
 
+    def defer_quality(self, metrics, function, *args, **kwargs):
+        """Computes quality stats with ``function(*args, **kwargs)``, which returns a dict.
+
+        In a session with a quality phase, the call is deferred until every
+        benchmark has been timed, and then runs in a separate worker pool; the
+        function and its arguments must be picklable.  Otherwise it runs now.
+        The names of the stats it returns are given by ``metrics``: until they
+        are computed, or if that fails, their values are None.
+        """
+        if self.quality_phase:
+            self.info.quality_stats.update(dict.fromkeys(metrics))
+            self.info.deferred_quality.append((function, args, kwargs))
+        else:
+            self.info.quality_stats.update(function(*args, **kwargs))
+
+    def time_phase(self, phase, function, *args, **kwargs):
+        """Calls a function once, outside the benchmark, and records its time as a phase."""
+        start = default_timer()
+        result = function(*args, **kwargs)
+        self.info.update_phase(phase, default_timer() - start)
+        return result
+
     def _make_runner(self, function_to_benchmark, args, kwargs):
         def runner(num_runs):
             gc_enabled = gc.isenabled()
@@ -141,8 +250,16 @@ class BenchmarkFixture:
         return duration, num_runs
 
     def __call__(self, function_to_benchmark, *args, **kwargs):
+        global _num_benchmarks  # pylint: disable=global-statement
         runner = self._make_runner(function_to_benchmark, args, kwargs)
+        baseline = _start_memory_tracking()
         duration, result = runner(None)
+        self.info.peak_memory = _peak_memory(baseline)
+        # The first call pays for lazy imports and warms the tool's caches; it
+        # is cold if no benchmark ran in this process before.
+        self.info.first_call = duration
+        self.info.cold = _num_benchmarks == 0
+        _num_benchmarks += 1
 
         if duration >= self._max_time:
             if duration < 300:
@@ -3,45 +3,59 @@
 # See accompanying file /LICENSE for details.
 # ------------------------------------------------------------------------------
 
-"""Benchmarks of application circuits."""
+"""Benchmarks of application circuits.
+
+Qiskit is imported by the benchmarks and circuit builders that use it, not when
+the games are collected.
+"""
 import pytest
 
-from qiskit.compiler import transpile
-from qiskit.result import marginal_distribution
-from qiskit.providers.fake_provider import (
-    FakeWashington,
-    FakeBrooklyn,
-    FakeRochester,
-    FakeMontreal,
-    FakeCairo,
-    FakeToronto,
-    FakeGuadalupe,
-    FakeMelbourne,
-)
-from qiskit.quantum_info.analysis import hellinger_fidelity
+from red_queen.imports import LazyObject, timed_import
+from .circuits import SEED, application_sizes, cached_circuit, random_bits
+from .simulation import estimated_success_probability, sampled_fidelity
+
+_FAKE_PROVIDER = "qiskit.providers.fake_provider"
 
+# Backends are only instantiated when a benchmark first uses them.
 backends = [
-    FakeWashington(),
-    FakeBrooklyn(),
-    FakeRochester(),
-    FakeMontreal(),
-    FakeCairo(),
-    FakeToronto(),
-    FakeGuadalupe(),
-    FakeMelbourne(),
+    LazyObject(_FAKE_PROVIDER, "FakeWashington"),
+    LazyObject(_FAKE_PROVIDER, "FakeBrooklyn"),
+    LazyObject(_FAKE_PROVIDER, "FakeRochester"),
+    LazyObject(_FAKE_PROVIDER, "FakeMontreal"),
+    LazyObject(_FAKE_PROVIDER, "FakeCairo"),
+    LazyObject(_FAKE_PROVIDER, "FakeToronto"),
+    LazyObject(_FAKE_PROVIDER, "FakeGuadalupe"),
+    LazyObject(_FAKE_PROVIDER, "FakeMelbourne"),
 ]
 
+# Simulating wider circuits with noise, for as many shots, takes far longer than
+# transpiling them: their success probability is estimated instead, even with
+# ``--fidelity sampled``.  The ``fidelity`` parameter of a benchmark records which
+# metric it has.  The circuits simulated before application sizes were
+# parametrized had 3 to 8 qubits.
+MAX_SIMULATED_QUBITS = 8
+
+
+def require_qubits(backend, num_qubits):
+    """Skips the benchmark if the backend is too small for the circuit."""
+    if num_qubits > backend.configuration().n_qubits:
+        pytest.skip(f"{backend} has fewer than {num_qubits} qubits")
+
 
 def run_qiskit_circuit(
     benchmark, circuit, backend, optimization_level, shots, expected_counts, marginalize=None
 ):
+    lazy_backend = backend
+    backend = backend.resolve()
+    require_qubits(backend, circuit.num_qubits)
     info, tqc = benchmark(
-        transpile,
+        timed_import("qiskit.compiler").transpile,
         circuit,
         backend,
         optimization_level=optimization_level,
         seed_transpiler=4242424242,
     )
+    info.size = {"gates": circuit.size(), "qubits": circuit.num_qubits, "device": backend.name()}
     info.quality_stats["depth"] = tqc.depth()
     info.quality_stats["size"] = tqc.size()
     op_count = tqc.count_ops()
@@ -51,13 +65,12 @@ def run_qiskit_circuit(
     else:
         num_1q = op_count.get("sx", 0) + op_count.get("x", 0) + op_count.get("rz", 0)
     info.quality_stats["xi"] = num_2q / (num_1q + num_2q)
-    if marginalize:
-
-        counts = marginal_distribution(
-            backend.run(tqc, shots=shots, seed_simulator=123456789).result().get_counts(),
-            marginalize,
-        )
-    else:
-        counts = backend.run(tqc, shots=shots, seed_simulator=123456789).result().get_counts()
-
-    info.quality_stats["fidelity"] = hellinger_fidelity(counts, expected_counts)
+    if benchmark.fidelity == "estimated" or circuit.num_qubits > MAX_SIMULATED_QUBITS:
+        info.parameters["fidelity"] = "estimated"
+        info.quality_stats["esp"] = estimated_success_probability(tqc, backend)
+        return
+    info.parameters["fidelity"] = "sampled"
+    # The simulation is much slower than the transpilation, it may be deferred
+    benchmark.defer_quality(
+        ["fidelity"], sampled_fidelity, tqc, lazy_backend, shots, expected_counts, marginalize
+    )
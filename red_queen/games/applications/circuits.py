@@ -0,0 +1,62 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Application circuits of a given size, built once and kept in the cache.
+
+Circuits are built by the games' own builders, with a fixed seed for any
+random choice (e.g. secret strings), so every session benchmarks the same
+circuits.  They are stored as QPY in the Red Queen cache, keyed by the builder,
+its arguments and the content of the module defining it, so editing a game
+rebuilds its circuits.
+"""
+
+import hashlib
+import inspect
+import io
+import json
+import random
+from functools import lru_cache
+
+from red_queen.cache import DiskCache, file_digest
+from red_queen.imports import timed_import
+
+# Problem sizes, in qubits, up to the largest backend
+application_sizes = [4, 8, 16, 32, 64, 127]
+SEED = 42
+
+_circuits = {}
+
+
+@lru_cache(maxsize=None)
+def _circuit_cache():
+    return DiskCache("applications", f"qiskit-{timed_import('qiskit').__version__}")
+
+
+def random_bits(num_bits, seed=SEED):
+    """Returns a reproducible random bit string."""
+    return format(random.Random(seed).getrandbits(num_bits), f"0{num_bits}b")
+
+
+def cached_circuit(build, *args):
+    """Returns ``build(*args)``, building it only if it isn't cached yet.
+
+    The returned circuit is shared, callers must not modify it.
+    """
+    source = file_digest(inspect.getfile(build))
+    inputs = json.dumps([build.__module__, build.__qualname__, source, SEED, args])
+    key = hashlib.sha256(inputs.encode("utf-8")).hexdigest()
+    if key in _circuits:
+        return _circuits[key]
+    qpy = timed_import("qiskit.qpy")
+    data = _circuit_cache().get(key)
+    if data is not None:
+        circuit = qpy.load(io.BytesIO(data))[0]
+    else:
+        circuit = build(*args)
+        buffer = io.BytesIO()
+        qpy.dump(circuit, buffer)
+        _circuit_cache().put(key, buffer.getvalue())
+    _circuits[key] = circuit
+    return circuit
@@ -6,21 +6,24 @@
 """Deustch Jozsa Benchmark Circuits"""
 
 
-import os
-import numpy as np
-from qiskit import QuantumCircuit
-import pytest
-from red_queen.games.applications import backends, run_qiskit_circuit
-
+import random
 
-QASM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qasm")
-NUM = 5
+import pytest
+from red_queen.games.applications import (
+    SEED,
+    application_sizes,
+    backends,
+    cached_circuit,
+    run_qiskit_circuit,
+)
+from red_queen.imports import timed_import
 
 
-def constant(n):
+def constant(n, rng):
     """Creates a constant oracle"""
-    qc = QuantumCircuit(n + 1)
-    output = np.random.randint(2)
+    qiskit = timed_import("qiskit")
+    qc = qiskit.QuantumCircuit(n + 1)
+    output = rng.randrange(2)
     if output == 1:
         qc.x(n)
     c_oracle = qc.to_gate()
@@ -28,10 +31,11 @@ def constant(n):
     return c_oracle
 
 
-def balanced(n):
+def balanced(n, rng):
     """Creates a balanced oracle"""
-    qc = QuantumCircuit(n + 1)
-    b = np.random.randint(1, 2**n)
+    qiskit = timed_import("qiskit")
+    qc = qiskit.QuantumCircuit(n + 1)
+    b = rng.randrange(1, 2**n)
     bstr = format(b, "0" + str(n) + "b")
     for i, qubit in enumerate(bstr):
         if qubit == "1":
@@ -46,18 +50,19 @@ def balanced(n):
     return b_oracle
 
 
-def oracle(case, n):
+def oracle(case, n, rng):
     """Returns oracle based on case"""
     if case == "balanced":
-        return balanced(n)
+        return balanced(n, rng)
     if case == "constant":
-        return constant(n)
+        return constant(n, rng)
     return None
 
 
 def dj_alg(ora_cle, n):
     """Creates Deustch Jozsa circuit"""
-    dj = QuantumCircuit(n + 1, n)
+    qiskit = timed_import("qiskit")
+    dj = qiskit.QuantumCircuit(n + 1, n)
     dj.x(n)
     dj.h(n)
     for i in range(n):
@@ -70,9 +75,9 @@ def dj_alg(ora_cle, n):
     return dj
 
 
-def build_dj(case, n):
+def build_dj(case, n, seed=SEED):
     """Builds circuit"""
-    dj_oracle = oracle(case, n)
+    dj_oracle = oracle(case, n, random.Random(seed))
     dj = dj_alg(dj_oracle, n)
     return dj
 
@@ -81,20 +86,17 @@ def build_dj(case, n):
 @pytest.mark.parametrize("optimization_level", [0, 1, 2, 3])
 @pytest.mark.parametrize("backend", backends)
 @pytest.mark.parametrize("case", ["balanced", "constant"])
-def bench_qiskit_dj(benchmark, optimization_level, backend, case):
+@pytest.mark.parametrize("size", application_sizes)
+def bench_qiskit_dj(benchmark, optimization_level, backend, case, size):
     shots = 20000
+    # One qubit holds the oracle's output
+    num = size - 1
     if case == "balanced":
-        benchmark.name = "Deutsch Jozsa - Balanced Oracle"
-        expected_counts = {str("1" * NUM): shots}
-        circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "dj_balanced.qasm"))
+        benchmark.name = f"Deutsch Jozsa - Balanced Oracle ({size} qubits)"
+        expected_counts = {str("1" * num): shots}
     else:
-        benchmark.name = "Deutsch Jozsa - Constant Oracle"
-        expected_counts = {str("0" * NUM): shots}
-        circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "dj_constant.qasm"))
+        benchmark.name = f"Deutsch Jozsa - Constant Oracle ({size} qubits)"
+        expected_counts = {str("0" * num): shots}
+    circ = cached_circuit(build_dj, case, num)
     benchmark.algorithm = f"Optimization level: {optimization_level} on {backend.name()}"
     run_qiskit_circuit(benchmark, circ, backend, optimization_level, shots, expected_counts)
-
-
-if __name__ == "__main__":
-    build_dj("balanced", NUM).qasm(filename=os.path.join(QASM_DIR, "dj_balanced.qasm"))
-    build_dj("constant", NUM).qasm(filename=os.path.join(QASM_DIR, "dj_constant.qasm"))
@@ -24,23 +24,17 @@
 """
 Grover's Search Benchmark Program - Qiskit
 """
-import os
-
 import pytest
 
 import numpy as np
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from red_queen.games.applications import backends, run_qiskit_circuit
-
-QASM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qasm")
+from red_queen.games.applications import backends, cached_circuit, random_bits, run_qiskit_circuit
+from red_queen.imports import timed_import
 
 
 _USE_MCX_SHIM = False
-QUBIT_COUNT = 4
-SECRET_STATE = 12
-
 
-np.random.seed(0)
+# The number of iterations grows as 2**(n/2), so Grover's search stays small
+GROVER_SIZES = [4, 6, 8, 10]
 
 
 ############### Circuit Definition
@@ -48,12 +42,13 @@ np.random.seed(0)
 
 def grovers_search(num_qubits, marked_item):
     """This function creates the grovers search algorithm circuit"""
+    qiskit = timed_import("qiskit")
     quantum_c = None
     n_iterations = int(np.pi * np.sqrt(2**num_qubits) / 4)
     # allocate qubits
-    q_r = QuantumRegister(num_qubits)
-    c_r = ClassicalRegister(num_qubits)
-    q_c = QuantumCircuit(q_r, c_r, name="main")
+    q_r = qiskit.QuantumRegister(num_qubits)
+    c_r = qiskit.ClassicalRegister(num_qubits)
+    q_c = qiskit.QuantumCircuit(q_r, c_r, name="main")
 
     # Start with Hadamard on all qubits
     for i_qubit in range(num_qubits):
@@ -88,11 +83,12 @@ def grovers_search(num_qubits, marked_item):
 
 def add_grover_oracle(num_qubits, marked_item):
     """This line of code creates the oracles needed for grover's circuit"""
+    qiskit = timed_import("qiskit")
     grover_oracle = None
     marked_item_bits = format(marked_item, f"0{num_qubits}b")[::-1]
 
-    q_r = QuantumRegister(num_qubits)
-    q_c = QuantumCircuit(q_r, name="oracle")
+    q_r = qiskit.QuantumRegister(num_qubits)
+    q_c = qiskit.QuantumCircuit(q_r, name="oracle")
 
     for (q_var, bit) in enumerate(marked_item_bits):
         if not int(bit):
@@ -125,9 +121,10 @@ def add_grover_oracle(num_qubits, marked_item):
 
 def add_diffusion_operator(num_qubits):
     """This function creates the diffusion operator for grover's circuit"""
+    qiskit = timed_import("qiskit")
     diffusion_operator = None
-    q_r = QuantumRegister(num_qubits)
-    q_c = QuantumCircuit(q_r, name="diffuser")
+    q_r = qiskit.QuantumRegister(num_qubits)
+    q_c = qiskit.QuantumCircuit(q_r, name="diffuser")
 
     for i_qubit in range(num_qubits):
         q_c.h(q_r[i_qubit])
@@ -213,16 +210,13 @@ def add_mcx(q_c, controls, target):
 @pytest.mark.qiskit
 @pytest.mark.parametrize("optimization_level", [0, 1, 2, 3])
 @pytest.mark.parametrize("backend", backends)
-def bench_qiskit_grovers(benchmark, optimization_level, backend):
+@pytest.mark.parametrize("size", GROVER_SIZES)
+def bench_qiskit_grovers(benchmark, optimization_level, backend, size):
     """This code is what is used to benchmark grover's search algorithm"""
     shots = 70000
-    expected_counts = {format(SECRET_STATE, "b").zfill(QUBIT_COUNT): shots}
-    benchmark.name = "Grover's Search Algorithm"
-    circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "grover.qasm"))
+    secret_state = random_bits(size)
+    expected_counts = {secret_state: shots}
+    benchmark.name = f"Grover's Search Algorithm ({size} qubits)"
+    circ = cached_circuit(grovers_search, size, int(secret_state, 2))
     benchmark.algorithm = f"Optimization level: {optimization_level} on {backend.name()}"
     run_qiskit_circuit(benchmark, circ, backend, optimization_level, shots, expected_counts)
-
-
-if __name__ == "__main__":
-    # saved circuits for display
-    grovers_search(QUBIT_COUNT, SECRET_STATE).qasm(filename=os.path.join(QASM_DIR, "grover.qasm"))
@@ -15,21 +15,25 @@
 """Hidden Shift Benchmark Circuit"""
 
 # initialization
-import os
 import pytest
-from qiskit import QuantumCircuit
-from red_queen.games.applications import backends, run_qiskit_circuit
-
-QASM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qasm")
+from red_queen.games.applications import (
+    application_sizes,
+    backends,
+    cached_circuit,
+    random_bits,
+    run_qiskit_circuit,
+)
+from red_queen.imports import timed_import
 
 # ---------------------------------------------------------------------------------------------
-NUM_QUBITS = 6  # number of input qubits
-SECRET_STRING = "010110"  # the binary hidden shift string
+# The oracles pair up qubits, so the number of qubits must be even
+HS_SIZES = [size - size % 2 for size in application_sizes]
 
 
 def the_shift(num_qubits, secret_string):
     """the shifting operation for the given secret_string"""
-    shift = QuantumCircuit(num_qubits)
+    qiskit = timed_import("qiskit")
+    shift = qiskit.QuantumCircuit(num_qubits)
     secret_string = secret_string[::-1]  # reverses secret_string qubit ordering
     for i_qubit in range(num_qubits):
         if secret_string[i_qubit] == "0":  # skips every secret_string qubit == 0
@@ -42,7 +46,8 @@ def the_shift(num_qubits, secret_string):
 
 def g_oracle(num_qubits, secret_string):
     """defining the g oracle"""
-    oracle_g = QuantumCircuit(num_qubits)
+    qiskit = timed_import("qiskit")
+    oracle_g = qiskit.QuantumCircuit(num_qubits)
 
     # shifts the qubits
     oracle_g.append(the_shift(num_qubits, secret_string), range(num_qubits))
@@ -63,7 +68,8 @@ def g_oracle(num_qubits, secret_string):
 
 def f_oracle(num_qubits):
     """oracle circuit that encodes Fourier Transform"""
-    oracle_f = QuantumCircuit(num_qubits)
+    qiskit = timed_import("qiskit")
+    oracle_f = qiskit.QuantumCircuit(num_qubits)
 
     for i_qubit in range(int(num_qubits / 2)):
         oracle_f.cz(i_qubit, i_qubit + int(num_qubits / 2))
@@ -77,7 +83,8 @@ def f_oracle(num_qubits):
 
 def hs_circuit(num_qubits, secret_string):
     """setting up hidden shift circuit"""
-    hs = QuantumCircuit(num_qubits, num_qubits)
+    qiskit = timed_import("qiskit")
+    hs = qiskit.QuantumCircuit(num_qubits, num_qubits)
 
     # apply Hadamard gates to all qubits to make superposition
     for i_qubit in range(num_qubits):
@@ -107,16 +114,14 @@ def hs_circuit(num_qubits, secret_string):
 @pytest.mark.qiskit
 @pytest.mark.parametrize("optimization_level", [0, 1, 2, 3])
 @pytest.mark.parametrize("backend", backends)
-def bench_qiskit_hs(benchmark, optimization_level, backend):
+@pytest.mark.parametrize("size", HS_SIZES)
+def bench_qiskit_hs(benchmark, optimization_level, backend, size):
     """benchmarking for hidden_shift"""
     shots = 33333
-    expected_counts = {SECRET_STRING: shots}
-    benchmark.name = "Hidden Shift"
-    circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "hs.qasm"))
+    secret_string = random_bits(size)  # the binary hidden shift string
+    expected_counts = {secret_string: shots}
+    benchmark.name = f"Hidden Shift ({size} qubits)"
+    circ = cached_circuit(hs_circuit, size, secret_string)
 
     benchmark.algorithm = f"Optimization level: {optimization_level} on {backend.name()}"
     run_qiskit_circuit(benchmark, circ, backend, optimization_level, shots, expected_counts)
-
-
-if __name__ == "__main__":
-    hs_circuit(NUM_QUBITS, SECRET_STRING).qasm(filename=os.path.join(QASM_DIR, "hs.qasm"))
@@ -1,33 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[7];
-creg c0[6];
-x q0[6];
-h q0[0];
-h q0[1];
-h q0[2];
-h q0[3];
-h q0[4];
-h q0[5];
-h q0[6];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6];
-cx q0[0],q0[6];
-cx q0[1],q0[6];
-cx q0[4],q0[6];
-cx q0[5],q0[6];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6];
-h q0[0];
-h q0[1];
-h q0[2];
-h q0[3];
-h q0[4];
-h q0[5];
-h q0[6];
-x q0[6];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[2] -> c0[2];
-measure q0[3] -> c0[3];
-measure q0[4] -> c0[4];
-measure q0[5] -> c0[5];
@@ -1,52 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q1[2];
-creg c1[6];
-x q1[1];
-h q1[1];
-barrier q1[0],q1[1];
-h q1[0];
-cx q1[0],q1[1];
-h q1[0];
-measure q1[0] -> c1[0];
-reset q1[0];
-reset q1[1];
-x q1[1];
-h q1[1];
-barrier q1[0],q1[1];
-h q1[0];
-cx q1[0],q1[1];
-h q1[0];
-measure q1[0] -> c1[1];
-reset q1[0];
-reset q1[1];
-x q1[1];
-h q1[1];
-barrier q1[0],q1[1];
-measure q1[0] -> c1[2];
-reset q1[0];
-reset q1[1];
-x q1[1];
-h q1[1];
-barrier q1[0],q1[1];
-measure q1[0] -> c1[3];
-reset q1[0];
-reset q1[1];
-x q1[1];
-h q1[1];
-barrier q1[0],q1[1];
-h q1[0];
-cx q1[0],q1[1];
-h q1[0];
-measure q1[0] -> c1[4];
-reset q1[0];
-reset q1[1];
-x q1[1];
-h q1[1];
-barrier q1[0],q1[1];
-h q1[0];
-cx q1[0],q1[1];
-h q1[0];
-measure q1[0] -> c1[5];
-reset q1[0];
-reset q1[1];
@@ -1,104 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[8];
-creg c0[8];
-x q0[7];
-x q0[6];
-x q0[5];
-x q0[4];
-x q0[3];
-x q0[2];
-x q0[1];
-x q0[0];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7];
-h q0[7];
-crz(pi/2) q0[6],q0[7];
-h q0[6];
-crz(pi/4) q0[6],q0[7];
-crz(pi/2) q0[5],q0[6];
-h q0[5];
-crz(pi/8) q0[6],q0[7];
-crz(pi/4) q0[5],q0[6];
-crz(pi/2) q0[4],q0[5];
-h q0[4];
-crz(pi/16) q0[6],q0[7];
-crz(pi/8) q0[5],q0[6];
-crz(pi/4) q0[4],q0[5];
-crz(pi/2) q0[3],q0[4];
-h q0[3];
-crz(pi/32) q0[6],q0[7];
-crz(pi/16) q0[5],q0[6];
-crz(pi/8) q0[4],q0[5];
-crz(pi/4) q0[3],q0[4];
-crz(pi/2) q0[2],q0[3];
-h q0[2];
-crz(pi/64) q0[6],q0[7];
-crz(pi/32) q0[5],q0[6];
-crz(pi/16) q0[4],q0[5];
-crz(pi/8) q0[3],q0[4];
-crz(pi/4) q0[2],q0[3];
-crz(pi/2) q0[1],q0[2];
-h q0[1];
-crz(pi/128) q0[6],q0[7];
-crz(pi/64) q0[5],q0[6];
-crz(pi/32) q0[4],q0[5];
-crz(pi/16) q0[3],q0[4];
-crz(pi/8) q0[2],q0[3];
-crz(pi/4) q0[1],q0[2];
-crz(pi/2) q0[0],q0[1];
-h q0[0];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7];
-rz(pi) q0[0];
-rz(pi/2) q0[1];
-rz(pi/4) q0[2];
-rz(pi/8) q0[3];
-rz(pi/16) q0[4];
-rz(pi/32) q0[5];
-rz(pi/64) q0[6];
-rz(pi/128) q0[7];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7];
-h q0[0];
-crz(-pi/2) q0[0],q0[1];
-crz(-pi/4) q0[1],q0[2];
-crz(-pi/8) q0[2],q0[3];
-crz(-pi/16) q0[3],q0[4];
-crz(-pi/32) q0[4],q0[5];
-crz(-pi/64) q0[5],q0[6];
-crz(-pi/128) q0[6],q0[7];
-h q0[1];
-crz(-pi/2) q0[1],q0[2];
-crz(-pi/4) q0[2],q0[3];
-crz(-pi/8) q0[3],q0[4];
-crz(-pi/16) q0[4],q0[5];
-crz(-pi/32) q0[5],q0[6];
-crz(-pi/64) q0[6],q0[7];
-h q0[2];
-crz(-pi/2) q0[2],q0[3];
-crz(-pi/4) q0[3],q0[4];
-crz(-pi/8) q0[4],q0[5];
-crz(-pi/16) q0[5],q0[6];
-crz(-pi/32) q0[6],q0[7];
-h q0[3];
-crz(-pi/2) q0[3],q0[4];
-crz(-pi/4) q0[4],q0[5];
-crz(-pi/8) q0[5],q0[6];
-crz(-pi/16) q0[6],q0[7];
-h q0[4];
-crz(-pi/2) q0[4],q0[5];
-crz(-pi/4) q0[5],q0[6];
-crz(-pi/8) q0[6],q0[7];
-h q0[5];
-crz(-pi/2) q0[5],q0[6];
-crz(-pi/4) q0[6],q0[7];
-h q0[6];
-crz(-pi/2) q0[6],q0[7];
-h q0[7];
-barrier q0[0],q0[1],q0[2],q0[3],q0[4],q0[5],q0[6],q0[7];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[2] -> c0[2];
-measure q0[3] -> c0[3];
-measure q0[4] -> c0[4];
-measure q0[5] -> c0[5];
-measure q0[6] -> c0[6];
-measure q0[7] -> c0[7];
@@ -1,67 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q1[8];
-creg c1[8];
-h q1[0];
-h q1[1];
-h q1[2];
-h q1[3];
-h q1[4];
-h q1[5];
-h q1[6];
-h q1[7];
-barrier q1[0],q1[1],q1[2],q1[3],q1[4],q1[5],q1[6],q1[7];
-rz(255*pi) q1[0];
-rz(400.55306) q1[1];
-rz(200.27653) q1[2];
-rz(100.13827) q1[3];
-rz(50.069133) q1[4];
-rz(25.034566) q1[5];
-rz(12.517283) q1[6];
-rz(6.2586416) q1[7];
-barrier q1[0],q1[1],q1[2],q1[3],q1[4],q1[5],q1[6],q1[7];
-h q1[0];
-crz(-pi/2) q1[0],q1[1];
-crz(-pi/4) q1[1],q1[2];
-crz(-pi/8) q1[2],q1[3];
-crz(-pi/16) q1[3],q1[4];
-crz(-pi/32) q1[4],q1[5];
-crz(-pi/64) q1[5],q1[6];
-crz(-pi/128) q1[6],q1[7];
-h q1[1];
-crz(-pi/2) q1[1],q1[2];
-crz(-pi/4) q1[2],q1[3];
-crz(-pi/8) q1[3],q1[4];
-crz(-pi/16) q1[4],q1[5];
-crz(-pi/32) q1[5],q1[6];
-crz(-pi/64) q1[6],q1[7];
-h q1[2];
-crz(-pi/2) q1[2],q1[3];
-crz(-pi/4) q1[3],q1[4];
-crz(-pi/8) q1[4],q1[5];
-crz(-pi/16) q1[5],q1[6];
-crz(-pi/32) q1[6],q1[7];
-h q1[3];
-crz(-pi/2) q1[3],q1[4];
-crz(-pi/4) q1[4],q1[5];
-crz(-pi/8) q1[5],q1[6];
-crz(-pi/16) q1[6],q1[7];
-h q1[4];
-crz(-pi/2) q1[4],q1[5];
-crz(-pi/4) q1[5],q1[6];
-crz(-pi/8) q1[6],q1[7];
-h q1[5];
-crz(-pi/2) q1[5],q1[6];
-crz(-pi/4) q1[6],q1[7];
-h q1[6];
-crz(-pi/2) q1[6],q1[7];
-h q1[7];
-barrier q1[0],q1[1],q1[2],q1[3],q1[4],q1[5],q1[6],q1[7];
-measure q1[0] -> c1[0];
-measure q1[1] -> c1[1];
-measure q1[2] -> c1[2];
-measure q1[3] -> c1[3];
-measure q1[4] -> c1[4];
-measure q1[5] -> c1[5];
-measure q1[6] -> c1[6];
-measure q1[7] -> c1[7];
@@ -1,21 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-gate mcx q0,q1,q2,q3 { h q3; p(pi/8) q0; p(pi/8) q1; p(pi/8) q2; p(pi/8) q3; cx q0,q1; p(-pi/8) q1; cx q0,q1; cx q1,q2; p(-pi/8) q2; cx q0,q2; p(pi/8) q2; cx q1,q2; p(-pi/8) q2; cx q0,q2; cx q2,q3; p(-pi/8) q3; cx q1,q3; p(pi/8) q3; cx q2,q3; p(-pi/8) q3; cx q0,q3; p(pi/8) q3; cx q2,q3; p(-pi/8) q3; cx q1,q3; p(pi/8) q3; cx q2,q3; p(-pi/8) q3; cx q0,q3; h q3; }
-gate oracle q0,q1,q2,q3 { x q0; x q1; h q3; mcx q0,q1,q2,q3; h q3; x q0; x q1; }
-gate diffuser q0,q1,q2,q3 { h q0; h q1; h q2; h q3; x q0; x q1; x q2; x q3; h q3; mcx q0,q1,q2,q3; h q3; x q0; x q1; x q2; x q3; h q0; h q1; h q2; h q3; }
-qreg q0[4];
-creg c0[4];
-h q0[0];
-h q0[1];
-h q0[2];
-h q0[3];
-oracle q0[0],q0[1],q0[2],q0[3];
-diffuser q0[0],q0[1],q0[2],q0[3];
-oracle q0[0],q0[1],q0[2],q0[3];
-diffuser q0[0],q0[1],q0[2],q0[3];
-oracle q0[0],q0[1],q0[2],q0[3];
-diffuser q0[0],q0[1],q0[2],q0[3];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[2] -> c0[2];
-measure q0[3] -> c0[3];
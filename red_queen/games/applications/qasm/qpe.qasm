@@ -1,22 +0,0 @@
-OPENQASM 2.0;
-include "qelib1.inc";
-qreg q0[4];
-creg c0[3];
-x q0[3];
-h q0[0];
-h q0[1];
-h q0[2];
-cp(pi/4) q0[0],q0[3];
-cp(pi/2) q0[1],q0[3];
-cp(pi) q0[2],q0[3];
-barrier q0[0],q0[1],q0[2],q0[3];
-swap q0[0],q0[2];
-h q0[0];
-cp(-pi/2) q0[0],q0[1];
-h q0[1];
-cp(-pi/4) q0[0],q0[2];
-cp(-pi/2) q0[1],q0[2];
-h q0[2];
-measure q0[0] -> c0[0];
-measure q0[1] -> c0[1];
-measure q0[2] -> c0[2];
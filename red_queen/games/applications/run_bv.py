@@ -5,26 +5,27 @@
 
 """Benchmark Bernstein Vazirani circuits."""
 
-import os
-
 import pytest
 
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-
-from red_queen.games.applications import backends, run_qiskit_circuit
-
 
-QASM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qasm")
-SECRET_STRING = "110011"
+from red_queen.games.applications import (
+    application_sizes,
+    backends,
+    cached_circuit,
+    random_bits,
+    run_qiskit_circuit,
+)
+from red_queen.imports import timed_import
 
 
 def build_bv_circuit(secret_string, mid_circuit_measure=False):
+    qiskit = timed_import("qiskit")
     input_size = len(secret_string)
     num_qubits = input_size + 1
     if not mid_circuit_measure:
-        qr = QuantumRegister(num_qubits)
-        cr = ClassicalRegister(input_size)
-        qc = QuantumCircuit(qr, cr, name="main")
+        qr = qiskit.QuantumRegister(num_qubits)
+        cr = qiskit.ClassicalRegister(input_size)
+        qc = qiskit.QuantumCircuit(qr, cr, name="main")
         qc.x(qr[input_size])
         qc.h(qr)
         qc.barrier()
@@ -37,9 +38,9 @@ def build_bv_circuit(secret_string, mid_circuit_measure=False):
         qc.barrier()
         qc.measure(qr[:-1], cr)
     else:
-        qr = QuantumRegister(2)
-        cr = ClassicalRegister(input_size)
-        qc = QuantumCircuit(qr, cr, name="main")
+        qr = qiskit.QuantumRegister(2)
+        cr = qiskit.ClassicalRegister(input_size)
+        qc = qiskit.QuantumCircuit(qr, cr, name="main")
         for i in range(input_size):
             qc.x(qr[1])
             qc.h(qr[1])
@@ -58,19 +59,17 @@ def build_bv_circuit(secret_string, mid_circuit_measure=False):
 @pytest.mark.parametrize("optimization_level", [0, 1, 2, 3])
 @pytest.mark.parametrize("backend", backends)
 @pytest.mark.parametrize("method", ["normal", "mid-circuit measurement"])
-def bench_qiskit_bv(benchmark, optimization_level, backend, method):
+@pytest.mark.parametrize("size", application_sizes)
+def bench_qiskit_bv(benchmark, optimization_level, backend, method, size):
     shots = 65536
-    expected_counts = {SECRET_STRING: shots}
+    # The secret string takes all qubits but the target one
+    secret_string = random_bits(size - 1)
+    expected_counts = {secret_string: shots}
     if method == "normal":
-        benchmark.name = "Bernstein Vazirani"
-        circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "bv.qasm"))
+        benchmark.name = f"Bernstein Vazirani ({size} qubits)"
+        circ = cached_circuit(build_bv_circuit, secret_string)
     else:
-        benchmark.name = "Bernstein Vazirani (mid-circuit measurement)"
-        circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "bv_mcm.qasm"))
+        benchmark.name = f"Bernstein Vazirani (mid-circuit measurement, {size - 1} bits)"
+        circ = cached_circuit(build_bv_circuit, secret_string, True)
     benchmark.algorithm = f"Optimization level: {optimization_level} on {backend.name()}"
     run_qiskit_circuit(benchmark, circ, backend, optimization_level, shots, expected_counts)
-
-
-if __name__ == "__main__":
-    build_bv_circuit(SECRET_STRING).qasm(filename=os.path.join(QASM_DIR, "bv.qasm"))
-    build_bv_circuit(SECRET_STRING, True).qasm(filename=os.path.join(QASM_DIR, "bv_mcm.qasm"))
@@ -12,27 +12,26 @@
 
 """Benchmark for Quantum Fourier Transform"""
 
-import os
 import pytest
-from red_queen.games.applications import backends, run_qiskit_circuit
+from red_queen.games.applications import (
+    application_sizes,
+    backends,
+    cached_circuit,
+    random_bits,
+    run_qiskit_circuit,
+)
+from red_queen.imports import timed_import
 import numpy as np
 
-# Importing standard Qiskit libraries
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-
-
-DIRECTORY = "qasm"
-QASM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), DIRECTORY)
-SECRET_STRING = "11111111"
-
 
 """ Generates Quantum Fourier Transform circuit using QFT and Inverse QFT"""
 
 
 def generate_ft_circuit_1(binary):
-    qubits = QuantumRegister(len(binary))
-    bits = ClassicalRegister(len(binary))
-    qc = QuantumCircuit(qubits, bits, name="FT1")
+    qiskit = timed_import("qiskit")
+    qubits = qiskit.QuantumRegister(len(binary))
+    bits = qiskit.ClassicalRegister(len(binary))
+    qc = qiskit.QuantumCircuit(qubits, bits, name="FT1")
     for digit, number in enumerate(binary):
         if number == "1":
             qc.x((len(qubits) - 1) - digit)
@@ -62,10 +61,11 @@ def generate_ft_circuit_1(binary):
 
 
 def generate_ft_circuit_2(binary):
+    qiskit = timed_import("qiskit")
     integer_value = int(binary, 2)
-    qubits = QuantumRegister(len(binary))
-    bits = ClassicalRegister(len(binary))
-    qc = QuantumCircuit(qubits, bits, name="FT2")
+    qubits = qiskit.QuantumRegister(len(binary))
+    bits = qiskit.ClassicalRegister(len(binary))
+    qc = qiskit.QuantumCircuit(qubits, bits, name="FT2")
     for qubit in range(len(qubits)):
         qc.h(qubit)
     qc.barrier()
@@ -87,23 +87,20 @@ def generate_ft_circuit_2(binary):
 @pytest.mark.parametrize("optimization_level", [0, 1, 2, 3])
 @pytest.mark.parametrize("backend", backends)
 @pytest.mark.parametrize("method", ["1", "2"])
-def bench_qiskit_ft(benchmark, optimization_level, backend, method):
+@pytest.mark.parametrize("size", application_sizes)
+def bench_qiskit_ft(benchmark, optimization_level, backend, method, size):
     shots = 65536
-    integer_value = int(SECRET_STRING, 2)
-    binary_1 = format((integer_value + 1) % (2 ** (len(SECRET_STRING))), "b").zfill(
-        len(SECRET_STRING)
+    secret_string = random_bits(size)
+    integer_value = int(secret_string, 2)
+    binary_1 = format((integer_value + 1) % (2 ** (len(secret_string))), "b").zfill(
+        len(secret_string)
     )
-    expected_counts = {binary_1: shots} if method == "1" else {SECRET_STRING: shots}
+    expected_counts = {binary_1: shots} if method == "1" else {secret_string: shots}
     if method == "1":
-        benchmark.name = "Quantum Fourier Transform v1"
-        circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "ft_1.qasm"))
+        benchmark.name = f"Quantum Fourier Transform v1 ({size} qubits)"
+        circ = cached_circuit(generate_ft_circuit_1, secret_string)
     else:
-        benchmark.name = "Quantum Fourier Transform v2"
-        circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "ft_2.qasm"))
+        benchmark.name = f"Quantum Fourier Transform v2 ({size} qubits)"
+        circ = cached_circuit(generate_ft_circuit_2, secret_string)
     benchmark.algorithm = f"Optimization level: {optimization_level} on {backend.name()}"
     run_qiskit_circuit(benchmark, circ, backend, optimization_level, shots, expected_counts)
-
-
-if __name__ == "__main__":
-    generate_ft_circuit_1(SECRET_STRING).qasm(filename=os.path.join(QASM_DIR, "ft_1.qasm"))
-    generate_ft_circuit_2(SECRET_STRING).qasm(filename=os.path.join(QASM_DIR, "ft_2.qasm"))
@@ -10,16 +10,13 @@
 
 """Quantum Phase Estimation"""
 
-import os
 import math
 import pytest
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from applications import backends, run_qiskit_circuit
+from applications import application_sizes, backends, cached_circuit, run_qiskit_circuit
+from red_queen.imports import timed_import
 
 
-QASM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qasm")
 SECRET_ANGLE = 1 / 8
-NUMQUBITS = 4
 
 # This will convert the fraction into binary for the secret angle
 # Code taken from https://www.codespeedy.com/convert-decimal-fraction-to-binary-in-python/
@@ -53,13 +50,14 @@ def qft_dagger(qc, n):
 
 
 def quantum_phase_estimation(num_of_qubits, angle):
+    qiskit = timed_import("qiskit")
 
     cqubits = num_of_qubits - 1  # there is one less for the counting qubits
 
     # setting up the circuit
-    qr = QuantumRegister(num_of_qubits)
-    cr = ClassicalRegister(cqubits)
-    qc = QuantumCircuit(qr, cr)
+    qr = qiskit.QuantumRegister(num_of_qubits)
+    cr = qiskit.ClassicalRegister(cqubits)
+    qc = qiskit.QuantumCircuit(qr, cr)
 
     # initialize the state
     qc.x(cqubits)
@@ -95,16 +93,12 @@ def quantum_phase_estimation(num_of_qubits, angle):
 @pytest.mark.qiskit
 @pytest.mark.parametrize("optimization_level", [0, 1, 2, 3])
 @pytest.mark.parametrize("backend", backends)
-def bench_qiskit_bv(benchmark, optimization_level, backend):
+@pytest.mark.parametrize("size", application_sizes)
+def bench_qiskit_bv(benchmark, optimization_level, backend, size):
     shots = 65536
-    expected_counts = {fraction_bin(SECRET_ANGLE): shots}
-    benchmark.name = "Quantum Phase Estimation"
-    circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "qpe.qasm"))
+    # The secret angle is exact in the counting qubits, all but one
+    expected_counts = {fraction_bin(SECRET_ANGLE).ljust(size - 1, "0"): shots}
+    benchmark.name = f"Quantum Phase Estimation ({size} qubits)"
+    circ = cached_circuit(quantum_phase_estimation, size, SECRET_ANGLE)
     benchmark.algorithm = f"Optimization level: {optimization_level} on {backend.name()}"
     run_qiskit_circuit(benchmark, circ, backend, optimization_level, shots, expected_counts)
-
-
-if __name__ == "__main__":
-    quantum_phase_estimation(NUMQUBITS, SECRET_ANGLE).qasm(
-        filename=os.path.join(QASM_DIR, "qpe.qasm")
-    )
@@ -5,15 +5,12 @@
 
 """Quantum Teleportation Benchmark Circuits"""
 
-import os
 import pytest
 import numpy as np
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit import IBMQ, Aer, transpile
-from red_queen.games.applications import backends, run_qiskit_circuit
+from red_queen.games.applications import backends, cached_circuit, run_qiskit_circuit
+from red_queen.imports import timed_import
 
 
-QASM_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "qasm")
 state = [1 / np.sqrt(2), -1 / np.sqrt(2)]
 
 
@@ -44,9 +41,10 @@ def initgate(qc, qubit):
 
 
 def build_qteleportation():
-    qr = QuantumRegister(3, name="q")
-    z, x = ClassicalRegister(1, name="classz"), ClassicalRegister(1, name="classx")
-    teleportation_circuit = QuantumCircuit(qr, z, x)
+    qiskit = timed_import("qiskit")
+    qr = qiskit.QuantumRegister(3, name="q")
+    z, x = qiskit.ClassicalRegister(1, name="classz"), qiskit.ClassicalRegister(1, name="classx")
+    teleportation_circuit = qiskit.QuantumCircuit(qr, z, x)
 
     initgate(teleportation_circuit, 0)
     teleportation_circuit.barrier()
@@ -63,7 +61,7 @@ def build_qteleportation():
 
     initgate(teleportation_circuit, 2)
 
-    cr_result = ClassicalRegister(1)
+    cr_result = qiskit.ClassicalRegister(1)
     teleportation_circuit.add_register(cr_result)
     teleportation_circuit.measure(2, 2)
 
@@ -77,12 +75,8 @@ def bench_quantum_teleportation(benchmark, optimization_level, backend):
     shots = 65536
     expected_counts = {"1": shots}
     benchmark.name = "Quantum Teleportation"
-    circ = QuantumCircuit.from_qasm_file(os.path.join(QASM_DIR, "quantum_teleportation.qasm"))
+    circ = cached_circuit(build_qteleportation)
     benchmark.algorithm = f"Optimization level: {optimization_level} on {backend.name()}"
     run_qiskit_circuit(
         benchmark, circ, backend, optimization_level, shots, expected_counts, marginalize=[2]
     )
-
-
-if __name__ == "__main__":
-    build_qteleportation().qasm(filename=os.path.join(QASM_DIR, "quantum_teleportation.qasm"))
@@ -0,0 +1,105 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Benchmark transpiling batches of small application circuits.
+
+Production jobs transpile many small circuits at once, where the fixed cost of
+each call matters as much as the passes themselves.  Batches are transpiled
+both one circuit at a time and through qiskit's own parallel path, and the
+report compares their throughput (batch size over mean time).
+"""
+
+import os
+
+import pytest
+
+from red_queen.games.applications import backends, cached_circuit, random_bits
+from red_queen.imports import timed_import
+
+# Modules, not functions: pytest would collect their imported benchmarks here
+from red_queen.games.applications import dj, hidden_shift, run_bv, run_ft
+
+BATCH_SIZES = [32, 256]
+# Small circuits, as in production batches
+_BATCH_WIDTHS = [4, 6, 8]
+
+
+def batch_circuits(size):
+    """Returns a reproducible batch of small application circuits."""
+    circuits = []
+    for seed in range(size):
+        width = _BATCH_WIDTHS[seed % len(_BATCH_WIDTHS)]
+        kind = seed % 4
+        if kind == 0:
+            circuits.append(cached_circuit(run_bv.build_bv_circuit, random_bits(width - 1, seed)))
+        elif kind == 1:
+            circuits.append(cached_circuit(dj.build_dj, "balanced", width - 1, seed))
+        elif kind == 2:
+            circuits.append(
+                cached_circuit(hidden_shift.hs_circuit, width, random_bits(width, seed))
+            )
+        else:
+            circuits.append(cached_circuit(run_ft.generate_ft_circuit_1, random_bits(width, seed)))
+    return circuits
+
+
+def _parallel_workers(batch):
+    """Returns how many processes qiskit's ``parallel_map`` transpiles a batch with.
+
+    That is ``QISKIT_NUM_PROCS``, or the number of physical cores, unless
+    parallelism is disabled (by the user's config, ``QISKIT_PARALLEL``, or in a
+    process that ``parallel_map`` itself started).
+    """
+    try:
+        from qiskit.utils import parallel  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        from qiskit.tools import parallel  # pylint: disable=import-outside-toplevel
+    if hasattr(parallel, "should_run_in_parallel"):
+        enabled = parallel.should_run_in_parallel()
+    else:
+        enabled = (
+            parallel.CPU_COUNT > 1
+            and os.getenv("QISKIT_IN_PARALLEL", "FALSE") == "FALSE"
+            and parallel.CONFIG.get("parallel_enabled", parallel.PARALLEL_DEFAULT)
+        )
+    if batch < 2 or not enabled:
+        return 1
+    return min(parallel.CPU_COUNT, batch)
+
+
+def _transpile_serially(circuits, backend, **kwargs):
+    transpile = timed_import("qiskit.compiler").transpile
+    return [transpile(circuit, backend, **kwargs) for circuit in circuits]
+
+
+@pytest.mark.qiskit
+@pytest.mark.parametrize("optimization_level", [0, 1, 2, 3])
+@pytest.mark.parametrize("backend", backends)
+@pytest.mark.parametrize("mode", ["serial", "parallel"])
+@pytest.mark.parametrize("batch", BATCH_SIZES)
+def bench_qiskit_throughput(benchmark, optimization_level, backend, mode, batch):
+    circuits = batch_circuits(batch)
+    backend = backend.resolve()
+    benchmark.name = f"Batch transpile ({batch} circuits)"
+    benchmark.algorithm = f"{mode}, Optimization level: {optimization_level} on {backend.name()}"
+    if mode == "serial":
+        run = _transpile_serially
+    else:
+        run = timed_import("qiskit.compiler").transpile
+    info, _ = benchmark(
+        run, circuits, backend, optimization_level=optimization_level, seed_transpiler=4242424242
+    )
+    info.parameters.update(
+        batch=batch,
+        mode=mode,
+        workers=1 if mode == "serial" else _parallel_workers(batch),
+        optimization_level=optimization_level,
+        backend=backend.name(),
+    )
+    info.size = {
+        "gates": sum(circuit.size() for circuit in circuits),
+        "qubits": max(circuit.num_qubits for circuit in circuits),
+        "device": backend.name(),
+    }
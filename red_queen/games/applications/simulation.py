@@ -0,0 +1,214 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Noisy simulation of transpiled application circuits.
+
+A transpiled circuit is defined on every qubit of the backend, most of which
+it doesn't touch.  Before simulating it, idle qubits are dropped and the
+backend's noise model is built for the remaining ones only, so a small circuit
+on a 127-qubit device is simulated as a small circuit.  The noise on the kept
+qubits is the same as on the full device.
+
+The simulator seed is fixed, so the counts of a run only depend on the
+transpiled circuit, the backend and the number of shots.  They are kept in the
+Red Queen cache under a hash of those inputs: different optimization levels
+that produce the same circuit, and later sessions, don't simulate it again.
+
+Qiskit is imported on first use, so collecting the games, or running them
+with another tool, doesn't load it.  Aer is only imported once a circuit is
+simulated, so sessions that estimate fidelities (``--fidelity estimated``)
+never load it.
+
+Within a pawn, the errors of a backend's gates and readouts are computed once,
+on first use.  The noise model of a set of qubits only picks theirs.
+"""
+
+import hashlib
+import json
+from importlib import metadata
+
+import numpy as np
+from red_queen.cache import DiskCache
+from red_queen.imports import LazyObject, timed_import
+
+SEED_SIMULATOR = 123456789
+
+_counts_cache = DiskCache("counts")
+
+# Per-pawn caches, keyed by backend name
+_properties = {}
+_gate_errors_tables = {}
+_noise_tables = {}
+
+
+def _simulator_version():
+    try:
+        return metadata.version("qiskit-aer")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def compact_circuit(circuit):
+    """Drops the qubits a circuit doesn't use.
+
+    Returns the compacted circuit and the original index of each of its qubits.
+    Barriers are dropped as well, classical registers are kept as they are.
+    """
+    qubits = sorted(
+        {
+            circuit.find_bit(qubit).index
+            for instruction in circuit.data
+            if instruction.operation.name != "barrier"
+            for qubit in instruction.qubits
+        }
+    )
+    index = {circuit.qubits[qubit]: i for i, qubit in enumerate(qubits)}
+    qiskit = timed_import("qiskit")
+    register = qiskit.QuantumRegister(len(qubits), "q")
+    compact = qiskit.QuantumCircuit(register, *circuit.cregs, name=circuit.name)
+    for instruction in circuit.data:
+        if instruction.operation.name == "barrier":
+            continue
+        compact.append(
+            instruction.operation,
+            [compact.qubits[index[qubit]] for qubit in instruction.qubits],
+            instruction.clbits,
+        )
+    return compact, tuple(qubits)
+
+
+def _backend_properties(backend):
+    name = backend.name()
+    if name not in _properties:
+        _properties[name] = backend.properties().to_dict()
+    return _properties[name]
+
+
+def _device_errors(backend):
+    """Returns the gate and readout errors of every qubit of the backend."""
+    name = backend.name()
+    if name not in _noise_tables:
+        device = timed_import("qiskit_aer.noise.device")
+        models = timed_import("qiskit.providers.models")
+        properties = models.BackendProperties.from_dict(_backend_properties(backend))
+        _noise_tables[name] = (
+            list(device.basic_device_gate_errors(properties)),
+            list(device.basic_device_readout_errors(properties)),
+        )
+    return _noise_tables[name]
+
+
+def noise_model(backend, qubits):
+    """Returns the noise model of the backend restricted to the given qubits.
+
+    This is what ``NoiseModel.from_backend`` builds, only for fewer qubits,
+    which are renumbered from 0.
+    """
+    gate_errors, readout_errors = _device_errors(backend)
+    index = {qubit: i for i, qubit in enumerate(qubits)}
+    model = timed_import("qiskit_aer.noise").NoiseModel(
+        basis_gates=backend.configuration().basis_gates
+    )
+    for name, gate_qubits, error in gate_errors:
+        if all(qubit in index for qubit in gate_qubits):
+            model.add_quantum_error(error, name, [index[qubit] for qubit in gate_qubits])
+    for gate_qubits, error in readout_errors:
+        if all(qubit in index for qubit in gate_qubits):
+            model.add_readout_error(error, [index[qubit] for qubit in gate_qubits])
+    return model
+
+
+def simulator(backend, qubits):
+    """Returns a noisy simulator of the backend restricted to the given qubits."""
+    return timed_import("qiskit_aer").AerSimulator(noise_model=noise_model(backend, qubits))
+
+
+def _gate_errors(backend):
+    """Returns the error of every calibrated gate, keyed by ``(name, qubits)``.
+
+    Measurements are keyed by ``("measure", (qubit,))`` with the readout error.
+    """
+    name = backend.name()
+    if name not in _gate_errors_tables:
+        properties = _backend_properties(backend)
+        errors = {}
+        for gate in properties["gates"]:
+            for parameter in gate["parameters"]:
+                if parameter["name"] == "gate_error":
+                    errors[(gate["gate"], tuple(gate["qubits"]))] = parameter["value"]
+        for qubit, parameters in enumerate(properties["qubits"]):
+            for parameter in parameters:
+                if parameter["name"] == "readout_error":
+                    errors[("measure", (qubit,))] = parameter["value"]
+        _gate_errors_tables[name] = errors
+    return _gate_errors_tables[name]
+
+
+def estimated_success_probability(circuit, backend):
+    """Estimates the probability that a transpiled circuit runs without error.
+
+    This is the product of the success probabilities (one minus the error) of
+    every gate and measurement, as calibrated in the backend's properties.
+    Gates without a calibrated error, such as virtual ``rz``, count as perfect.
+    """
+    errors = _gate_errors(backend)
+    gate_errors = np.fromiter(
+        (
+            errors.get(
+                (
+                    instruction.operation.name,
+                    tuple(circuit.find_bit(qubit).index for qubit in instruction.qubits),
+                ),
+                0.0,
+            )
+            for instruction in circuit.data
+        ),
+        dtype=float,
+    )
+    return float(np.exp(np.log1p(-gate_errors).sum()))
+
+
+def _counts_key(circuit, backend, qubits, shots, seed_simulator):
+    inputs = {
+        "circuit": circuit.qasm(),
+        "qubits": qubits,
+        "backend": backend.name(),
+        "backend_version": backend.configuration().backend_version,
+        "shots": shots,
+        "seed_simulator": seed_simulator,
+        "qiskit": timed_import("qiskit").__version__,
+        "aer": _simulator_version(),
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def simulate_counts(circuit, backend, shots, seed_simulator=SEED_SIMULATOR):
+    """Returns the counts of running a transpiled circuit on a (fake) backend."""
+    compact, qubits = compact_circuit(circuit)
+    key = _counts_key(compact, backend, qubits, shots, seed_simulator)
+    data = _counts_cache.get(key)
+    if data is not None:
+        return json.loads(data)
+    result = (
+        simulator(backend, qubits).run(compact, shots=shots, seed_simulator=seed_simulator).result()
+    )
+    counts = result.get_counts()
+    _counts_cache.put(key, json.dumps(counts).encode("utf-8"))
+    return counts
+
+
+def sampled_fidelity(circuit, backend, shots, expected_counts, marginalize=None):
+    """Returns the Hellinger fidelity of the simulated counts to the expected ones.
+
+    ``backend`` may be a `LazyObject`, and ``marginalize`` the classical bits to
+    keep in the counts.
+    """
+    if isinstance(backend, LazyObject):
+        backend = backend.resolve()
+    counts = simulate_counts(circuit, backend, shots)
+    if marginalize:
+        counts = timed_import("qiskit.result").marginal_distribution(counts, marginalize)
+    analysis = timed_import("qiskit.quantum_info.analysis")
+    return {"fidelity": analysis.hellinger_fidelity(counts, expected_counts)}
@@ -0,0 +1,169 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Qiskit mapping adapter."""
+
+import io
+from collections import defaultdict
+from pathlib import Path
+
+import qiskit
+from qiskit import QuantumCircuit, qpy
+from qiskit.transpiler import CouplingMap
+from qiskit.transpiler.passmanager import PassManager
+from qiskit.transpiler.passes import ApplyLayout
+from qiskit.transpiler.passes import CheckMap
+from qiskit.transpiler.passes import VF2Layout
+from qiskit.transpiler.passes import DenseLayout
+from qiskit.transpiler.passes import EnlargeWithAncilla
+from qiskit.transpiler.passes import FullAncillaAllocation
+from qiskit.transpiler.passes import SabreLayout
+from qiskit.transpiler.passes import SabreSwap
+from qiskit.transpiler.passes import StochasticSwap
+from red_queen.cache import DiskCache, cached_parse
+from .quality import gate_array, record_quality
+
+_circuit_cache = DiskCache("circuits", f"qiskit-{qiskit.__version__}")
+
+
+def _qpy_dumps(circuit):
+    buffer = io.BytesIO()
+    qpy.dump(circuit, buffer)
+    return buffer.getvalue()
+
+
+def _qpy_loads(data):
+    return qpy.load(io.BytesIO(data))[0]
+
+
+def load_circuit(path):
+    """Returns the circuit in a QASM file, parsing it only on a cache miss."""
+    return cached_parse(
+        path,
+        _circuit_cache,
+        QuantumCircuit.from_qasm_file,
+        _qpy_dumps,
+        _qpy_loads,
+    )
+
+
+def _build_coupling_map(device):
+    coupling_map = CouplingMap(device.bidirectional_edges)
+    # Routing passes need the distances, compute them outside the timed region
+    coupling_map.compute_distance_matrix()
+    return coupling_map
+
+
+def get_coupling_map(device):
+    """Returns the device's ``CouplingMap``, built once per pawn."""
+    return device.tool_object("qiskit", _build_coupling_map)
+
+
+def _qiskit_pass_manager(
+    layout_method,
+    routing_method,
+    device,
+    seed_transpiler=1337,
+    stochastic_trials=200,
+    sabre_iterations=5,
+    vf2_call_limit=int(5e4),  # Set call limit to ~100ms with retworkx 0.10.2
+    vf2_time_limit=0.1,
+):
+    coupling_map = get_coupling_map(device)
+    pm = PassManager()
+
+    _swap = []
+    if routing_method == "sabre":
+        _swap = [SabreSwap(coupling_map, heuristic="decay", seed=seed_transpiler)]
+    elif routing_method == "stochastic":
+        _swap = [StochasticSwap(coupling_map, trials=stochastic_trials, seed=seed_transpiler)]
+
+    # Choose an initial layout
+    _choose_layout_0 = VF2Layout(
+        coupling_map,
+        seed=seed_transpiler,
+        call_limit=vf2_call_limit,
+        time_limit=vf2_time_limit,
+    )
+    if layout_method == "sabre":
+        _choose_layout_1 = SabreLayout(
+            coupling_map,
+            routing_pass=_swap[0],
+            max_iterations=sabre_iterations,
+            seed=seed_transpiler,
+        )
+    elif layout_method == "dense":
+        _choose_layout_1 = DenseLayout(coupling_map)
+
+    def _choose_layout_condition(property_set):
+        return not property_set["layout"]
+
+    # Extend dag/layout with ancillae using the full coupling map
+    _embed = [FullAncillaAllocation(coupling_map), EnlargeWithAncilla(), ApplyLayout()]
+
+    _swap_check = CheckMap(coupling_map)
+
+    def _swap_condition(property_set):
+        return not property_set["is_swap_mapped"]
+
+    # Build pass manager
+    pm.append(_choose_layout_0, condition=_choose_layout_condition)
+    pm.append(_choose_layout_1, condition=_choose_layout_condition)
+    pm.append(_embed)
+    pm.append(_swap_check)
+    pm.append(_swap, condition=_swap_condition)
+    return pm
+
+
+def _gates(circuit):
+    index = {qubit: i for i, qubit in enumerate(circuit.qubits)}
+    for instruction in circuit.data:
+        name = instruction.operation.name
+        if name == "barrier":
+            continue
+        yield name, tuple(index[qubit] for qubit in instruction.qubits)
+
+
+# Passes not listed here are timed in the "other" phase
+_PASS_PHASES = {
+    "VF2Layout": "layout",
+    "SabreLayout": "layout",
+    "DenseLayout": "layout",
+    "FullAncillaAllocation": "embed",
+    "EnlargeWithAncilla": "embed",
+    "ApplyLayout": "embed",
+    "CheckMap": "routing",
+    "SabreSwap": "routing",
+    "StochasticSwap": "routing",
+}
+
+
+def _run_with_phases(pm, circuit, info):
+    phases = defaultdict(float)
+
+    def callback(pass_, time, **_):
+        phases[_PASS_PHASES.get(type(pass_).__name__, "other")] += time
+
+    mapped_circuit = pm.run(circuit, callback=callback)
+    for phase, duration in phases.items():
+        info.update_phase(phase, duration)
+    return mapped_circuit
+
+
+def run_mapper(benchmark, layout_method, routing_method, device, path, **effort):
+    if benchmark.time_parse:
+        benchmark.time_phase("parse", QuantumCircuit.from_qasm_file, str(path))
+    circuit = load_circuit(path)
+    pm = _qiskit_pass_manager(layout_method, routing_method, device, **effort)
+    info, mapped_circuit = benchmark(_run_with_phases, pm, circuit, benchmark.info)
+    layout = pm.property_set["layout"]
+    record_quality(
+        info,
+        Path(path),
+        gate_array(_gates(circuit)),
+        gate_array(_gates(mapped_circuit)),
+        device,
+        [layout[qubit] for qubit in circuit.qubits],
+    )
@@ -0,0 +1,84 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Tket mapping adapter."""
+
+import json
+from pathlib import Path
+from timeit import default_timer
+
+import pytket
+from pytket.qasm import circuit_from_qasm
+from pytket.passes import PlacementPass, RoutingPass
+from pytket.placement import GraphPlacement, LinePlacement
+from pytket.architecture import Architecture
+from pytket.circuit import Circuit
+from pytket.predicates import CompilationUnit
+from red_queen.cache import DiskCache, cached_parse
+from .quality import decompose_bridges, gate_array, record_quality
+
+_circuit_cache = DiskCache("circuits", f"pytket-{pytket.__version__}")
+
+
+def load_circuit(path):
+    """Returns the circuit in a QASM file, parsing it only on a cache miss."""
+    return cached_parse(
+        path,
+        _circuit_cache,
+        circuit_from_qasm,
+        lambda circuit: json.dumps(circuit.to_dict()).encode("utf-8"),
+        lambda data: Circuit.from_dict(json.loads(data)),
+    )
+
+
+def get_architecture(device):
+    """Returns the device's ``Architecture``, built once per pawn."""
+    return device.tool_object("tket", lambda device: Architecture(device.edges))
+
+
+def _gates(circuit):
+    for command in circuit.get_commands():
+        name = command.op.type.name.lower()
+        if name == "barrier":
+            continue
+        yield name, tuple(qubit.index[0] for qubit in command.qubits)
+
+
+def run_mapper(benchmark, layout_method, device, path):
+    architecture = get_architecture(device)
+    if layout_method == "line":
+        placement = PlacementPass(LinePlacement(architecture))
+    elif layout_method == "graph":
+        placement = PlacementPass(GraphPlacement(architecture))
+    mapping = RoutingPass(architecture)
+    if benchmark.time_parse:
+        benchmark.time_phase("parse", circuit_from_qasm, str(path))
+    circuit = load_circuit(path)
+    info, unit = benchmark(_tket_map_and_route, circuit, placement, mapping, benchmark.info)
+    # The router may emit bridges, which are profiled as the cx gates they stand for.
+    routed_circuit = gate_array(_gates(unit.circuit))
+    record_quality(
+        info,
+        Path(path),
+        gate_array(_gates(circuit)),
+        decompose_bridges(routed_circuit),
+        device,
+        [unit.initial_map[qubit].index[0] for qubit in circuit.qubits],
+        routed_circuit=routed_circuit,
+    )
+
+
+def _tket_map_and_route(circuit, placement, mapping, info):
+    # Things fail because of shared inplace modification without a copy
+    # doing the copy outside the timed method causes failures.  The compilation
+    # unit works on its own copy, and keeps track of the initial placement.
+    unit = CompilationUnit(circuit)
+    start = default_timer()
+    placement.apply(unit)
+    placed = default_timer()
+    mapping.apply(unit)
+    info.update_phase("layout", placed - start)
+    info.update_phase("routing", default_timer() - placed)
+    return unit
@@ -0,0 +1,80 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Tweedledum mapping adapter."""
+
+import pickle
+from importlib import metadata
+from pathlib import Path
+
+from tweedledum.ir import Circuit
+from tweedledum.target import Device
+from tweedledum.passes import bridge_decomp, bridge_map, jit_map, sabre_map
+from red_queen.cache import DiskCache, cached_parse
+from .quality import gate_array, record_quality
+
+_circuit_cache = DiskCache("circuits", f"tweedledum-{metadata.version('tweedledum')}")
+
+
+def load_circuit(path):
+    """Returns the circuit in a QASM file, parsing it only on a cache miss.
+
+    Circuits are pickled on disk when the tweedledum build supports it,
+    otherwise they are only reused within the pawn.
+    """
+    return cached_parse(
+        path,
+        _circuit_cache,
+        Circuit.from_qasm_file,
+        pickle.dumps,
+        pickle.loads,
+    )
+
+
+def get_target(device):
+    """Returns the device's tweedledum ``Device``, built once per pawn."""
+    return device.tool_object("tweedledum", lambda device: Device.from_edge_list(device.edges))
+
+
+def _gates(circuit):
+    for instruction in circuit:
+        name = instruction.kind().split(".")[-1]
+        if name == "barrier":
+            continue
+        qubits = tuple(qubit.uid() for qubit in instruction.qubits())
+        # Controls are qubits of the operator, name the CNOT like the other tools
+        if name == "x" and len(qubits) == 2:
+            name = "cx"
+        yield name, qubits
+
+
+def run_mapper(benchmark, routing_method, device, path):
+    """Runs one of tweedledum's mappers on a circuit.
+
+    Tweedledum's mappers place and route in a single call, so they are timed
+    as a whole, without layout and routing phases.
+    """
+    if benchmark.time_parse:
+        benchmark.time_phase("parse", Circuit.from_qasm_file, str(path))
+    circuit = load_circuit(path)
+    target = get_target(device)
+    if routing_method == "jit":
+        info, [mapped_circuit, mapping] = benchmark(jit_map, target, circuit)
+    elif routing_method == "sabre":
+        info, [mapped_circuit, mapping] = benchmark(sabre_map, target, circuit)
+    elif routing_method == "bridge":
+        info, [mapped_circuit, mapping] = benchmark(bridge_map, target, circuit)
+    routed_circuit = gate_array(_gates(mapped_circuit))
+    if routing_method == "bridge":
+        mapped_circuit = bridge_decomp(target, mapped_circuit)
+    record_quality(
+        info,
+        Path(path),
+        gate_array(_gates(circuit)),
+        gate_array(_gates(mapped_circuit)),
+        device,
+        [qubit.uid() for qubit in mapping.init_placement.v_to_phy()],
+        routed_circuit,
+    )
@@ -0,0 +1,102 @@
+# ------------------------------------------------------------------------------
+# Part of Qiskit.  This file is distributed under the Apache 2.0 License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Generator of QUEKO-style circuits with a known optimal depth.
+
+The construction follows QUEKO (see ``queko/README.md``): the circuit is built
+cycle by cycle directly on the physical qubits of a device, so under the
+identity layout every two-qubit gate lands on an edge and no swaps are needed.
+A chain of dependent "backbone" gates, one per cycle, makes the depth exactly
+the number of cycles.  Finally, the qubits are relabelled with a random
+permutation, which hides the optimal layout.
+
+Generated files are cached in the Red Queen cache and named like the QUEKO
+files, e.g. ``grid_24x24_100CYC_.5D1_.3D2_0.qasm``.
+"""
+
+import json
+import random
+
+from red_queen.cache import DiskCache
+
+
+def _density(value):
+    return f"{value:g}".lstrip("0") or "0"
+
+
+def _cycles(device, depth, one_qubit_density, two_qubit_density, rng):
+    """Yields the gates of each cycle as ``(a,)`` or ``(a, b)`` physical qubits."""
+    num_two_qubit = round(two_qubit_density * device.num_qubits / 2)
+    num_one_qubit = round(one_qubit_density * device.num_qubits)
+    edges = list(device.edges)
+    current = rng.randrange(device.num_qubits)
+    for _ in range(depth):
+        busy = [False] * device.num_qubits
+        cycle = []
+        # The backbone gate must act on the qubit used by the previous one
+        if num_two_qubit and device.neighbors[current]:
+            neighbor = rng.choice(device.neighbors[current])
+            cycle.append((current, neighbor))
+            busy[current] = busy[neighbor] = True
+            current = rng.choice((current, neighbor))
+        else:
+            cycle.append((current,))
+            busy[current] = True
+        rng.shuffle(edges)
+        for a, b in edges:
+            if len(cycle) >= num_two_qubit:
+                break
+            if not busy[a] and not busy[b]:
+                cycle.append((a, b))
+                busy[a] = busy[b] = True
+        idle = [qubit for qubit in range(device.num_qubits) if not busy[qubit]]
+        rng.shuffle(idle)
+        cycle.extend((qubit,) for qubit in idle[:num_one_qubit])
+        yield cycle
+
+
+def queko_circuit(device, depth, one_qubit_density, two_qubit_density, seed=0):
+    """Returns the path of a QUEKO-style circuit for ``device``.
+
+    Args:
+        device: the device (see `mapping.devices`) the circuit is built for.
+        depth: the optimal depth of the circuit.
+        one_qubit_density: fraction of the qubits acted on by a single-qubit
+            gate in each cycle.
+        two_qubit_density: fraction of the qubits acted on by a two-qubit gate
+            in each cycle.
+        seed: seed of the random generator.
+
+    Returns:
+        Path: the QASM file.  Next to it, a ``.layout.json`` file holds the
+        optimal layout: the physical qubit of each logical qubit.
+    """
+    name = (
+        f"{device.name}_{depth}CYC_{_density(one_qubit_density)}D1_"
+        f"{_density(two_qubit_density)}D2_{seed}"
+    )
+    cache = DiskCache("queko", device.digest[:16])
+    path = cache.get_path(f"{name}.qasm")
+    if path is not None and cache.get_path(f"{name}.layout.json") is not None:
+        return path
+
+    rng = random.Random(f"{device.digest}/{depth}/{one_qubit_density}/{two_qubit_density}/{seed}")
+    cycles = list(_cycles(device, depth, one_qubit_density, two_qubit_density, rng))
+    logical = list(range(device.num_qubits))
+    rng.shuffle(logical)
+    layout = [0] * device.num_qubits
+    for physical, qubit in enumerate(logical):
+        layout[qubit] = physical
+
+    lines = ["OPENQASM 2.0;", 'include "qelib1.inc";', f"qreg q[{device.num_qubits}];"]
+    for cycle in cycles:
+        for gate in cycle:
+            if len(gate) == 1:
+                lines.append(f"x q[{logical[gate[0]]}];")
+            else:
+                lines.append(f"cx q[{logical[gate[0]]}], q[{logical[gate[1]]}];")
+    lines.append("")
+    cache.put(f"{name}.layout.json", json.dumps(layout).encode("utf-8"))
+    return cache.put(f"{name}.qasm", "\n".join(lines).encode("utf-8"))
@@ -0,0 +1,95 @@
+# ------------------------------------------------------------------------------
+# Part of Qiskit.  This file is distributed under the Apache 2.0 License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Parametric device topologies.
+
+Each generator returns a list of undirected edges ``[a, b]``.  Devices can also
+be referred to by name, e.g. ``"heavy_hex_7x15"``, ``"grid_20x20"``,
+``"ring_500"`` or ``"full_64"`` (see `topology_edges`).
+"""
+
+import re
+
+
+def heavy_hex(rows, columns):
+    """Heavy-hex lattice as used by IBM devices.
+
+    The lattice has ``rows`` lines of ``columns`` qubits.  Consecutive lines are
+    joined by bridge qubits every fourth column, starting at column 0 and 2 in
+    alternate gaps.  For example, ``heavy_hex(7, 15)`` has 129 qubits (an Eagle
+    device without its two corner qubits has 127), ``heavy_hex(13, 27)`` has
+    435 qubits and ``heavy_hex(21, 43)`` has 1123 qubits.
+    """
+    edges = []
+    for row in range(rows):
+        start = row * columns
+        edges.extend([start + column, start + column + 1] for column in range(columns - 1))
+    bridge = rows * columns
+    for gap in range(rows - 1):
+        for column in range(2 * (gap % 2), columns, 4):
+            edges.append([gap * columns + column, bridge])
+            edges.append([bridge, (gap + 1) * columns + column])
+            bridge += 1
+    return edges
+
+
+def grid(rows, columns):
+    """Square grid with nearest-neighbour connectivity."""
+    edges = []
+    for row in range(rows):
+        for column in range(columns):
+            qubit = row * columns + column
+            if column + 1 < columns:
+                edges.append([qubit, qubit + 1])
+            if row + 1 < rows:
+                edges.append([qubit, qubit + columns])
+    return edges
+
+
+def ring(num_qubits):
+    """Cycle of ``num_qubits`` qubits, at least 3 so that every edge is distinct."""
+    if num_qubits < 3:
+        raise ValueError(f"A ring needs at least 3 qubits, not {num_qubits}")
+    return [[qubit, (qubit + 1) % num_qubits] for qubit in range(num_qubits)]
+
+
+def all_to_all(num_qubits):
+    """Complete graph on ``num_qubits`` qubits, at least 2 so that it has edges."""
+    if num_qubits < 2:
+        raise ValueError(f"An all-to-all device needs at least 2 qubits, not {num_qubits}")
+    return [[a, b] for a in range(num_qubits) for b in range(a + 1, num_qubits)]
+
+
+_TOPOLOGY_NAMES = [
+    (re.compile(r"heavy_hex_(\d+)x(\d+)"), heavy_hex),
+    (re.compile(r"grid_(\d+)x(\d+)"), grid),
+    (re.compile(r"ring_(\d+)"), ring),
+    (re.compile(r"full_(\d+)"), all_to_all),
+]
+
+
+def topology_edges(name):
+    """Returns the edges of a named topology, or None if the name is unknown."""
+    for pattern, generator in _TOPOLOGY_NAMES:
+        match = pattern.fullmatch(name)
+        if match:
+            return generator(*(int(group) for group in match.groups()))
+    return None
+
+
+# Devices used to study how mappers scale with the device size
+scaling_devices = [
+    "heavy_hex_7x15",
+    "heavy_hex_13x27",
+    "heavy_hex_21x43",
+    "grid_12x12",
+    "grid_24x24",
+    "grid_32x32",
+    "ring_128",
+    "ring_512",
+    "ring_1024",
+    "full_64",
+    "full_128",
+]
@@ -0,0 +1,105 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Devices shared by the mapping benchmarks.
+
+A device is built at most once per pawn, no matter how many benchmarks use it.
+Tool adapters keep their own representation of a device (e.g. a qiskit
+``CouplingMap``) in it through `Device.tool_object`, so those are built once
+per pawn as well.
+"""
+
+import hashlib
+import json
+from functools import cached_property, lru_cache
+
+import numpy as np
+
+from red_queen.imports import timed_import
+from .benchmarks import queko_coupling
+from .benchmarks.topologies import topology_edges
+
+
+class Device:
+    """A device coupling graph with undirected edges."""
+
+    def __init__(self, name, load_edges):
+        self.name = name
+        self._load_edges = load_edges
+        self._tool_objects = {}
+
+    def __repr__(self):
+        return self.name
+
+    @cached_property
+    def edges(self):
+        """Sorted list of undirected edges ``(a, b)`` with ``a < b``.
+
+        Devices without edges are rejected: nothing can be mapped on them.
+        """
+        edges = sorted({tuple(sorted(edge)) for edge in self._load_edges()})
+        if not edges:
+            raise ValueError(f"Device {self.name} has no edges")
+        return edges
+
+    @cached_property
+    def bidirectional_edges(self):
+        return [list(edge) for edge in self.edges] + [list(edge[::-1]) for edge in self.edges]
+
+    @cached_property
+    def num_qubits(self):
+        return max(max(edge) for edge in self.edges) + 1
+
+    @cached_property
+    def neighbors(self):
+        neighbors = [[] for _ in range(self.num_qubits)]
+        for a, b in self.edges:
+            neighbors[a].append(b)
+            neighbors[b].append(a)
+        return neighbors
+
+    @cached_property
+    def adjacency(self):
+        """Boolean matrix telling which pairs of qubits are coupled."""
+        adjacency = np.zeros((self.num_qubits, self.num_qubits), dtype=bool)
+        a, b = np.array(self.edges).T
+        adjacency[a, b] = True
+        adjacency[b, a] = True
+        return adjacency
+
+    @cached_property
+    def digest(self):
+        return hashlib.sha256(json.dumps(self.edges).encode("utf-8")).hexdigest()
+
+    def tool_object(self, tool, build):
+        """Returns the tool's representation of this device, built on first use."""
+        if tool not in self._tool_objects:
+            self._tool_objects[tool] = build(self)
+        return self._tool_objects[tool]
+
+
+def _fake_backend_edges(name):
+    def load_edges():
+        backend = getattr(timed_import("qiskit.providers.fake_provider"), name)()
+        return backend.configuration().coupling_map
+
+    return load_edges
+
+
+@lru_cache(maxsize=None)
+def get_device(name):
+    """Returns the device with the given name.
+
+    Known names are the QUEKO devices (e.g. ``"54QBT"``), qiskit's fake
+    backends (e.g. ``"FakeMontreal"``) and the generated topologies (e.g.
+    ``"heavy_hex_7x15"``, see `benchmarks.topologies`).
+    """
+    if name in queko_coupling:
+        return Device(name, lambda: queko_coupling[name])
+    if name.startswith("Fake"):
+        return Device(name, _fake_backend_edges(name))
+    if topology_edges(name) is not None:
+        return Device(name, lambda: topology_edges(name))
+    raise ValueError(f"Unknown device: {name}")
@@ -6,13 +6,13 @@
 """Misc mapping benchmarks."""
 
 import pytest
-from qiskit.providers.fake_provider import FakeMontreal
 
 from mapping import run_qiskit_mapper, run_tweedledum_mapper
+from mapping.devices import get_device
 from .benchmarks import misc_qasm
 
 
-backends = [FakeMontreal()]
+backends = [get_device("FakeMontreal")]
 
 
 @pytest.mark.qiskit
@@ -20,16 +20,10 @@ backends = [FakeMontreal()]
 @pytest.mark.parametrize("routing_method", ["sabre", "stochastic"])
 @pytest.mark.parametrize("backend", backends)
 @pytest.mark.parametrize("qasm", misc_qasm)
-def bench_qiskit(benchmark, layout_method, routing_method, backend, qasm) -> None:
+def bench_qiskit(benchmark, layout_method, routing_method, backend, qasm, seed) -> None:
     benchmark.name = qasm.name
     benchmark.algorithm = f"{layout_method} + {routing_method}"
-    run_qiskit_mapper(
-        benchmark,
-        layout_method,
-        routing_method,
-        backend.configuration().coupling_map,
-        qasm,
-    )
+    run_qiskit_mapper(benchmark, layout_method, routing_method, backend, qasm, seed=seed)
 
 
 @pytest.mark.tweedledum
@@ -39,4 +33,4 @@ def bench_qiskit(benchmark, layout_method, routing_method, backend, qasm) -> Non
 def bench_tweedledum(benchmark, routing_method, backend, qasm) -> None:
     benchmark.name = qasm.name
     benchmark.algorithm = routing_method
-    run_tweedledum_mapper(benchmark, routing_method, backend.configuration().coupling_map, qasm)
+    run_tweedledum_mapper(benchmark, routing_method, backend, qasm)
@@ -8,22 +8,19 @@
 import pytest
 
 from mapping import run_qiskit_mapper, run_tweedledum_mapper, run_tket_mapper
-from .benchmarks import queko_qasm, queko_coupling
+from mapping.devices import get_device
+from .benchmarks import queko_qasm
 
 
 @pytest.mark.qiskit
 @pytest.mark.parametrize("layout_method", ["dense", "sabre"])
 @pytest.mark.parametrize("routing_method", ["sabre", "stochastic"])
 @pytest.mark.parametrize("qasm", queko_qasm)
-def bench_qiskit(benchmark, layout_method, routing_method, qasm) -> None:
+def bench_qiskit(benchmark, layout_method, routing_method, qasm, seed) -> None:
     benchmark.name = qasm.name
     benchmark.algorithm = f"{layout_method} + {routing_method}"
-    # This is really annoying:
-    coupling_map = []
-    for pair in queko_coupling[benchmark.name[:5]]:
-        coupling_map.append(pair)
-        coupling_map.append(pair[::-1])
-    run_qiskit_mapper(benchmark, layout_method, routing_method, coupling_map, qasm)
+    device = get_device(benchmark.name[:5])
+    run_qiskit_mapper(benchmark, layout_method, routing_method, device, qasm, seed=seed)
 
 
 @pytest.mark.tweedledum
@@ -31,8 +28,8 @@ def bench_qiskit(benchmark, layout_method, routing_method, qasm) -> None:
 def bench_tweedledum(benchmark, qasm) -> None:
     benchmark.name = qasm.name
     benchmark.algorithm = "ApprxSatPlacer + LazyRouter"
-    coupling_map = queko_coupling[benchmark.name[:5]]
-    run_tweedledum_mapper(benchmark, "jit", coupling_map, qasm)
+    device = get_device(benchmark.name[:5])
+    run_tweedledum_mapper(benchmark, "jit", device, qasm)
 
 
 @pytest.mark.tket
@@ -41,5 +38,5 @@ def bench_tweedledum(benchmark, qasm) -> None:
 def bench_tket(benchmark, layout_method, qasm) -> None:
     benchmark.name = qasm.name
     benchmark.algorithm = f"{layout_method} Placement + Routing"
-    coupling_map = queko_coupling[benchmark.name[:5]]
-    run_tket_mapper(benchmark, layout_method, coupling_map, qasm)
+    device = get_device(benchmark.name[:5])
+    run_tket_mapper(benchmark, layout_method, device, qasm)
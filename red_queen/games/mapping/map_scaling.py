@@ -0,0 +1,54 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Mapping benchmarks on generated devices of growing size."""
+
+import pytest
+
+from mapping import run_qiskit_mapper, run_tweedledum_mapper, run_tket_mapper
+from mapping.devices import get_device
+from .benchmarks import misc_qasm
+from .benchmarks.topologies import scaling_devices
+
+_SCALING_CIRCUITS = [
+    "cnt3-5_180.qasm",
+    "ising_model_16.qasm",
+    "qft_16.qasm",
+    "rd84_142.qasm",
+    "sym6_316.qasm",
+]
+
+scaling_qasm = [path for path in misc_qasm if path.name in _SCALING_CIRCUITS]
+
+
+@pytest.mark.qiskit
+@pytest.mark.parametrize("layout_method", ["dense", "sabre"])
+@pytest.mark.parametrize("routing_method", ["sabre", "stochastic"])
+@pytest.mark.parametrize("device", scaling_devices)
+@pytest.mark.parametrize("qasm", scaling_qasm)
+def bench_qiskit(benchmark, layout_method, routing_method, device, qasm, seed) -> None:
+    benchmark.name = f"{qasm.name} on {device}"
+    benchmark.algorithm = f"{layout_method} + {routing_method}"
+    run_qiskit_mapper(benchmark, layout_method, routing_method, get_device(device), qasm, seed=seed)
+
+
+@pytest.mark.tweedledum
+@pytest.mark.parametrize("routing_method", ["jit", "sabre"])
+@pytest.mark.parametrize("device", scaling_devices)
+@pytest.mark.parametrize("qasm", scaling_qasm)
+def bench_tweedledum(benchmark, routing_method, device, qasm) -> None:
+    benchmark.name = f"{qasm.name} on {device}"
+    benchmark.algorithm = routing_method
+    run_tweedledum_mapper(benchmark, routing_method, get_device(device), qasm)
+
+
+@pytest.mark.tket
+@pytest.mark.parametrize("layout_method", ["graph", "line"])
+@pytest.mark.parametrize("device", scaling_devices)
+@pytest.mark.parametrize("qasm", scaling_qasm)
+def bench_tket(benchmark, layout_method, device, qasm) -> None:
+    benchmark.name = f"{qasm.name} on {device}"
+    benchmark.algorithm = f"{layout_method} Placement + Routing"
+    run_tket_mapper(benchmark, layout_method, get_device(device), qasm)
@@ -0,0 +1,48 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Mapping benchmarks sweeping the effort knobs of qiskit's anytime passes.
+
+Each effort scales the default knobs (200 stochastic trials, 5 Sabre layout
+iterations and VF2's call and time limits), so the results trace how quality
+improves with compile time.  The report draws a Pareto front per tool.
+"""
+
+import pytest
+
+from mapping import run_qiskit_mapper
+from mapping.devices import get_device
+from .benchmarks import misc_qasm
+
+_SWEEP_CIRCUITS = ["ising_model_16.qasm", "qft_16.qasm", "rd84_142.qasm"]
+
+sweep_qasm = [path for path in misc_qasm if path.name in _SWEEP_CIRCUITS]
+sweep_efforts = [0.1, 0.3, 1, 3, 10]
+
+
+def _effort_knobs(effort):
+    return {
+        "stochastic_trials": max(1, round(200 * effort)),
+        "sabre_iterations": max(1, round(5 * effort)),
+        "vf2_call_limit": max(1, round(5e4 * effort)),
+        "vf2_time_limit": 0.1 * effort,
+    }
+
+
+@pytest.mark.qiskit
+@pytest.mark.parametrize("layout_method", ["dense", "sabre"])
+@pytest.mark.parametrize("routing_method", ["sabre", "stochastic"])
+@pytest.mark.parametrize("effort", sweep_efforts)
+@pytest.mark.affinity("device", "qasm")
+@pytest.mark.parametrize("device", ["FakeMontreal"])
+@pytest.mark.parametrize("qasm", sweep_qasm)
+def bench_qiskit(benchmark, layout_method, routing_method, effort, device, qasm, seed) -> None:
+    knobs = _effort_knobs(effort)
+    benchmark.name = f"{qasm.name} effort sweep"
+    benchmark.algorithm = f"{layout_method} + {routing_method} x{effort}"
+    benchmark.info.parameters.update(effort=effort, **knobs)
+    run_qiskit_mapper(
+        benchmark, layout_method, routing_method, get_device(device), qasm, seed=seed, **knobs
+    )
@@ -0,0 +1,61 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Mapping benchmarks on generated QUEKO-style circuits with known optimal depth."""
+
+import pytest
+
+from mapping import run_qiskit_mapper, run_tweedledum_mapper, run_tket_mapper
+from mapping.devices import get_device
+from .benchmarks.synthetic import queko_circuit
+
+synthetic_devices = ["heavy_hex_7x15", "heavy_hex_13x27", "grid_24x24"]
+synthetic_depths = [50, 200]
+# (one-qubit, two-qubit) gate densities
+synthetic_densities = [(0.5, 0.3), (0.1, 0.6)]
+
+
+def _synthetic_qasm(device, depth, densities):
+    return queko_circuit(get_device(device), depth, *densities)
+
+
+@pytest.mark.qiskit
+@pytest.mark.parametrize("layout_method", ["dense", "sabre"])
+@pytest.mark.parametrize("routing_method", ["sabre", "stochastic"])
+@pytest.mark.affinity("device", "depth", "densities")
+@pytest.mark.parametrize("densities", synthetic_densities)
+@pytest.mark.parametrize("depth", synthetic_depths)
+@pytest.mark.parametrize("device", synthetic_devices)
+def bench_qiskit(benchmark, layout_method, routing_method, device, depth, densities, seed) -> None:
+    qasm = _synthetic_qasm(device, depth, densities)
+    benchmark.name = qasm.name
+    benchmark.algorithm = f"{layout_method} + {routing_method}"
+    run_qiskit_mapper(benchmark, layout_method, routing_method, get_device(device), qasm, seed=seed)
+
+
+@pytest.mark.tweedledum
+@pytest.mark.parametrize("routing_method", ["jit", "sabre"])
+@pytest.mark.affinity("device", "depth", "densities")
+@pytest.mark.parametrize("densities", synthetic_densities)
+@pytest.mark.parametrize("depth", synthetic_depths)
+@pytest.mark.parametrize("device", synthetic_devices)
+def bench_tweedledum(benchmark, routing_method, device, depth, densities) -> None:
+    qasm = _synthetic_qasm(device, depth, densities)
+    benchmark.name = qasm.name
+    benchmark.algorithm = routing_method
+    run_tweedledum_mapper(benchmark, routing_method, get_device(device), qasm)
+
+
+@pytest.mark.tket
+@pytest.mark.parametrize("layout_method", ["graph", "line"])
+@pytest.mark.affinity("device", "depth", "densities")
+@pytest.mark.parametrize("densities", synthetic_densities)
+@pytest.mark.parametrize("depth", synthetic_depths)
+@pytest.mark.parametrize("device", synthetic_devices)
+def bench_tket(benchmark, layout_method, device, depth, densities) -> None:
+    qasm = _synthetic_qasm(device, depth, densities)
+    benchmark.name = qasm.name
+    benchmark.algorithm = f"{layout_method} Placement + Routing"
+    run_tket_mapper(benchmark, layout_method, get_device(device), qasm)
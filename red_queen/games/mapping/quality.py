@@ -0,0 +1,223 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Quality metrics of mapped circuits, computed the same way for every tool.
+
+Adapters describe circuits as sequences of ``(name, qubits)`` pairs, where
+``name`` is the lower-case gate name without tool prefixes (e.g. ``"cx"`` or
+``"swap"``) and ``qubits`` a tuple of qubit indices.  Barriers are left out.
+`gate_array` packs such a sequence into an integer array once, and every
+metric is then computed from that array.
+
+A swap counts as three two-qubit gates, both in gate counts and in depths.  A
+``"bridge"`` on qubits ``(a, b, c)`` is a ``cx`` from ``a`` to ``c`` through
+``b``; routers that emit bridges are verified before `decompose_bridges`
+replaces them with four ``cx`` gates for profiling.
+"""
+
+import re
+from itertools import chain
+
+import numpy as np
+
+_OPTIMAL_DEPTH = re.compile(r"_(\d+)CYC_")
+
+# Gate array columns: the gate id followed by up to three qubits, padded with -1.
+# Gate ids are interned per process, so arrays built in one pawn are comparable.
+_GATE_IDS = {"swap": 0, "bridge": 1, "cx": 2}
+SWAP = _GATE_IDS["swap"]
+BRIDGE = _GATE_IDS["bridge"]
+CX = _GATE_IDS["cx"]
+MAX_QUBITS = 3
+_PADDING = [(-1,) * (MAX_QUBITS - num_qubits) for num_qubits in range(MAX_QUBITS + 1)]
+
+
+def optimal_depth(name):
+    """Returns the known optimal depth of a QUEKO circuit, or None."""
+    match = _OPTIMAL_DEPTH.search(name)
+    return int(match.group(1)) if match else None
+
+
+def _row(name, qubits):
+    if len(qubits) > MAX_QUBITS:
+        raise ValueError(f"Gate {name} acts on more than {MAX_QUBITS} qubits")
+    gate = _GATE_IDS.setdefault(name, len(_GATE_IDS))
+    return (gate, *qubits, *_PADDING[len(qubits)])
+
+
+def gate_array(gates):
+    """Packs ``(name, qubits)`` pairs into an ``(n, 4)`` array of gate ids and qubits."""
+    rows = chain.from_iterable(_row(name, qubits) for name, qubits in gates)
+    return np.fromiter(rows, dtype=np.int32).reshape(-1, MAX_QUBITS + 1)
+
+
+def decompose_bridges(gates):
+    """Returns a gate array with every bridge replaced by its four ``cx`` gates."""
+    bridges = gates[:, 0] == BRIDGE
+    if not bridges.any():
+        return gates
+    counts = np.where(bridges, 4, 1)
+    decomposed = np.repeat(gates, counts, axis=0)
+    rows = np.flatnonzero(np.repeat(bridges, counts))
+    a, b, c = decomposed[rows[::4], 1:].T
+    decomposed[rows, 0] = CX
+    decomposed[rows, 1] = np.stack([a, b, a, b], axis=1).ravel()
+    decomposed[rows, 2] = np.stack([b, c, b, c], axis=1).ravel()
+    decomposed[rows, 3] = -1
+    return decomposed
+
+
+def _depths(gates, weights):
+    """Returns the depth and two-qubit depth of a gate array.
+
+    Single-qubit gates are counted per qubit with numpy.  Gates on two or more
+    qubits are still walked one by one, as each one's level depends on those
+    before it, so the cost grows with the number of multi-qubit gates.
+    """
+    if not len(gates):
+        return 0, 0
+    num_gates = len(gates)
+    num_qubits = int(gates[:, 1:].max()) + 1
+    single = gates[:, 2] < 0
+    multi = np.flatnonzero(~single)
+    # Single-qubit gates sorted by qubit, then by position: the number of them on a
+    # qubit between two positions is the difference of their search positions.
+    keys = np.sort(gates[single, 1].astype(np.int64) * num_gates + np.flatnonzero(single))
+    bounds = np.searchsorted(keys, np.arange(num_qubits + 1, dtype=np.int64) * num_gates)
+    operands = gates[multi, 1:]
+    before = np.searchsorted(keys, operands.astype(np.int64) * num_gates + multi[:, None])
+    consumed = bounds[:-1].tolist()
+    levels = [0] * num_qubits
+    levels_2q = [0] * num_qubits
+    for (a, b, c), position, weight in zip(
+        operands.tolist(), before.tolist(), weights[multi].tolist()
+    ):
+        qubits = (a, b) if c < 0 else (a, b, c)
+        level = max(levels[q] + position[i] - consumed[q] for i, q in enumerate(qubits)) + weight
+        level_2q = max(levels_2q[qubit] for qubit in qubits) + weight
+        for i, qubit in enumerate(qubits):
+            levels[qubit] = level
+            levels_2q[qubit] = level_2q
+            consumed[qubit] = position[i]
+    depth = max(level + end - start for level, start, end in zip(levels, consumed, bounds[1:]))
+    return int(depth), max(levels_2q)
+
+
+def circuit_profile(gates, adjacency=None):
+    """Returns the gate counts and depths of a circuit given as a gate array.
+
+    With the boolean `adjacency` matrix of a device, the profile also counts the
+    multi-qubit gates that don't act on coupled qubits.
+    """
+    num_qubits = (gates[:, 1:] >= 0).sum(axis=1)
+    swaps = gates[:, 0] == SWAP
+    weights = np.where(swaps, 3, 1)
+    multi_qubit = num_qubits >= 2
+    depth, depth_2q = _depths(gates, weights)
+    profile = {
+        "gates": int(weights.sum()),
+        "2q_gates": int(weights[multi_qubit].sum()),
+        "swaps": int(swaps.sum()),
+        "depth": depth,
+        "2q_depth": depth_2q,
+    }
+    if adjacency is not None:
+        pairs = gates[multi_qubit]
+        coupled = (num_qubits[multi_qubit] == 2) & adjacency[pairs[:, 1], pairs[:, 2]]
+        profile["violations"] = int((~coupled).sum())
+    return profile
+
+
+def mapping_quality(name, circuit, mapped_circuit):
+    """Returns the quality metrics of a mapping given the two circuits' profiles.
+
+    ``cx`` is the number of two-qubit gates the mapping added.
+    """
+    stats = {
+        "cx": mapped_circuit["2q_gates"] - circuit["2q_gates"],
+        "swaps": mapped_circuit["swaps"],
+        "depth": mapped_circuit["depth"],
+        "added_2q_depth": mapped_circuit["2q_depth"] - circuit["2q_depth"],
+        "gate_overhead": mapped_circuit["gates"] / circuit["gates"] if circuit["gates"] else 1.0,
+    }
+    optimum = optimal_depth(name)
+    if optimum:
+        stats["depth_ratio"] = mapped_circuit["depth"] / optimum
+    return stats
+
+
+def _wire_sequences(gates, layout, adjacency=None):
+    """Returns the gates acting on each wire of a circuit, in order.
+
+    Wires are the qubits of the original circuit: `layout` gives the physical
+    qubit each of them starts on, and swaps move them around instead of being
+    recorded.  Physical qubits outside the layout are ancilla wires, numbered
+    after the circuit's.  Returns None if a bridge doesn't follow the coupling.
+    """
+    num_wires = len(layout)
+    num_qubits = max(int(gates[:, 1:].max(initial=-1)), max(layout, default=-1)) + 1
+    wires = list(range(num_wires, num_wires + num_qubits))
+    for wire, qubit in enumerate(layout):
+        wires[qubit] = wire
+    sequences = [[] for _ in range(num_wires + num_qubits)]
+    for gate, a, b, c in gates.tolist():
+        if gate == SWAP:
+            wires[a], wires[b] = wires[b], wires[a]
+            continue
+        if gate == BRIDGE:
+            if adjacency is not None and not (adjacency[a, b] and adjacency[b, c]):
+                return None
+            gate, qubits = CX, (a, c)
+        elif b < 0:
+            qubits = (a,)
+        else:
+            qubits = (a, b) if c < 0 else (a, b, c)
+        entry = (gate, tuple(wires[qubit] for qubit in qubits))
+        for wire in entry[1]:
+            sequences[wire].append(entry)
+    return sequences
+
+
+def verify_mapping(circuit, mapped_circuit, layout, adjacency):
+    """Checks that a mapped circuit implements `circuit` up to a final permutation.
+
+    Both circuits are gate arrays and `layout` lists the physical qubit each
+    qubit of `circuit` starts on.  The two circuits must apply the same gates,
+    in the same order, to every wire; gates on different wires may be
+    reordered.  Runs in time linear in the size of both circuits.
+    """
+    expected = _wire_sequences(circuit, range(len(layout)))
+    actual = _wire_sequences(mapped_circuit, layout, adjacency)
+    if actual is None:
+        return False
+    num_wires = len(layout)
+    if expected[:num_wires] != actual[:num_wires]:
+        return False
+    return not any(expected[num_wires:]) and not any(actual[num_wires:])
+
+
+def record_quality(info, path, circuit, mapped_circuit, device, layout, routed_circuit=None):
+    """Stores the quality of a mapping in the benchmark `info`.
+
+    All circuits are gate arrays and `layout` lists the physical qubit each
+    qubit of `circuit` starts on.  `routed_circuit` is the router's own output
+    when the mapped circuit is a decomposition of it (e.g. of bridges).  A
+    mapping with gates on uncoupled qubits, or one that doesn't implement the
+    original circuit, is marked as not valid.  The size of `circuit`, and the
+    device, are stored too.
+    """
+    info.size = {
+        "gates": len(circuit),
+        "qubits": int(circuit[:, 1:].max(initial=-1)) + 1,
+        "device": device.name,
+    }
+    mapped_profile = circuit_profile(mapped_circuit, device.adjacency)
+    info.quality_stats.update(mapping_quality(path.name, circuit_profile(circuit), mapped_profile))
+    if routed_circuit is None:
+        routed_circuit = mapped_circuit
+    if mapped_profile["violations"] or not verify_mapping(
+        circuit, routed_circuit, layout, device.adjacency
+    ):
+        info.valid = False
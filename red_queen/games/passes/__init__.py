@@ -0,0 +1,133 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Benchmarks of individual qiskit transpiler passes.
+
+Each benchmark times a single pass on a prepared input, so a regression in,
+say, ``SabreSwap`` shows up on its own instead of being diluted in a whole
+mapping run.  Inputs come from the mapping corpus: layout passes get the
+circuit's DAG, and routing passes get the DAG after a dense layout was applied
+to it.  Laid-out circuits are kept in the Red Queen cache and DAGs are built
+once per pawn, all outside the timed region.
+"""
+
+import io
+from collections import defaultdict
+from functools import lru_cache
+
+from mapping import get_qiskit_coupling_map, load_qiskit_circuit
+from mapping.devices import get_device
+from red_queen.cache import DiskCache, file_digest
+from red_queen.imports import timed_import
+
+SEED = 1337
+BASIS_GATES = ["cx", "id", "rz", "sx", "x"]
+
+
+# qiskit is only imported once a benchmark runs, not when the games are collected
+def _passes():
+    return timed_import("qiskit.transpiler.passes")
+
+
+# Pass factories taking a coupling map, with the knobs used by the mapping game
+layout_passes = {
+    "DenseLayout": lambda coupling_map: _passes().DenseLayout(coupling_map),
+    "SabreLayout": lambda coupling_map: _passes().SabreLayout(
+        coupling_map, max_iterations=5, seed=SEED
+    ),
+    "VF2Layout": lambda coupling_map: _passes().VF2Layout(
+        coupling_map, seed=SEED, call_limit=int(5e4), time_limit=0.1
+    ),
+}
+routing_passes = {
+    "SabreSwap": lambda coupling_map: _passes().SabreSwap(
+        coupling_map, heuristic="decay", seed=SEED
+    ),
+    "StochasticSwap": lambda coupling_map: _passes().StochasticSwap(
+        coupling_map, trials=200, seed=SEED
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _layout_cache():
+    return DiskCache("passes", f"qiskit-{timed_import('qiskit').__version__}")
+
+
+def _laid_out_circuit(path, device):
+    qpy = timed_import("qiskit.qpy")
+    key = f"{file_digest(path)}-{device.digest[:16]}.qpy"
+    data = _layout_cache().get(key)
+    if data is not None:
+        return qpy.load(io.BytesIO(data))[0]
+    coupling_map = get_qiskit_coupling_map(device)
+    passes = _passes()
+    pm = timed_import("qiskit.transpiler").PassManager(
+        [
+            passes.DenseLayout(coupling_map),
+            passes.FullAncillaAllocation(coupling_map),
+            passes.EnlargeWithAncilla(),
+            passes.ApplyLayout(),
+        ]
+    )
+    circuit = pm.run(load_qiskit_circuit(path))
+    buffer = io.BytesIO()
+    qpy.dump(circuit, buffer)
+    _layout_cache().put(key, buffer.getvalue())
+    return circuit
+
+
+@lru_cache(maxsize=8)
+def pass_input(path, device_name, stage):
+    """Returns the DAG a pass of the given stage (``"layout"`` or ``"routing"``) runs on.
+
+    The DAG is shared: only passes that don't modify their input may run on it.
+    """
+    circuit_to_dag = timed_import("qiskit.converters").circuit_to_dag
+    if stage == "layout":
+        return circuit_to_dag(load_qiskit_circuit(path))
+    return circuit_to_dag(_laid_out_circuit(path, get_device(device_name)))
+
+
+def run_pass(benchmark, pass_name, device_name, path):
+    """Times one layout or routing pass on a circuit of the mapping corpus."""
+    if pass_name in layout_passes:
+        factory, stage = layout_passes[pass_name], "layout"
+    else:
+        factory, stage = routing_passes[pass_name], "routing"
+    dag = pass_input(path, device_name, stage)
+    transpiler_pass = factory(get_qiskit_coupling_map(get_device(device_name)))
+    info, result = benchmark(transpiler_pass.run, dag)
+    info.size = {"gates": dag.size(), "qubits": dag.num_qubits(), "device": device_name}
+    if stage == "routing":
+        info.quality_stats["swaps"] = result.count_ops().get("swap", 0)
+
+
+def _run_with_pass_phases(pm, circuit, info):
+    passes = defaultdict(float)
+
+    def callback(pass_, time, **_):
+        passes[type(pass_).__name__] += time
+
+    result = pm.run(circuit, callback=callback)
+    for name, duration in passes.items():
+        info.update_phase(name, duration)
+    return result
+
+
+def run_preset(benchmark, optimization_level, device_name, path):
+    """Times a preset pass manager, recording the time of every pass as a phase."""
+    preset_passmanagers = timed_import("qiskit.transpiler.preset_passmanagers")
+    pm = preset_passmanagers.generate_preset_pass_manager(
+        optimization_level,
+        coupling_map=get_qiskit_coupling_map(get_device(device_name)),
+        basis_gates=BASIS_GATES,
+        seed_transpiler=SEED,
+    )
+    circuit = load_qiskit_circuit(path)
+    info, result = benchmark(_run_with_pass_phases, pm, circuit, benchmark.info)
+    info.size = {"gates": circuit.size(), "qubits": circuit.num_qubits, "device": device_name}
+    info.quality_stats["depth"] = result.depth()
+    info.quality_stats["size"] = result.size()
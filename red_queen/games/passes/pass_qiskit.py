@@ -0,0 +1,35 @@
+# ------------------------------------------------------------------------------
+# Part of Red Queen Project.  This file is distributed under the MIT License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Qiskit transpiler pass benchmarks."""
+
+import pytest
+
+from mapping.benchmarks import misc_qasm
+from passes import layout_passes, routing_passes, run_pass, run_preset
+
+devices = ["FakeMontreal"]
+
+
+@pytest.mark.qiskit
+@pytest.mark.parametrize("pass_name", list(layout_passes) + list(routing_passes))
+@pytest.mark.affinity("device", "qasm")
+@pytest.mark.parametrize("device", devices)
+@pytest.mark.parametrize("qasm", misc_qasm)
+def bench_qiskit_pass(benchmark, pass_name, device, qasm) -> None:
+    benchmark.name = f"{pass_name}: {qasm.name}"
+    benchmark.algorithm = pass_name
+    run_pass(benchmark, pass_name, device, qasm)
+
+
+@pytest.mark.qiskit
+@pytest.mark.parametrize("optimization_level", [0, 1, 2, 3])
+@pytest.mark.affinity("device", "qasm")
+@pytest.mark.parametrize("device", devices)
+@pytest.mark.parametrize("qasm", misc_qasm)
+def bench_qiskit_preset(benchmark, optimization_level, device, qasm) -> None:
+    benchmark.name = f"preset: {qasm.name}"
+    benchmark.algorithm = f"Optimization level: {optimization_level}"
+    run_preset(benchmark, optimization_level, device, qasm)
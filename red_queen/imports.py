@@ -0,0 +1,66 @@
+# ------------------------------------------------------------------------------
+# Part of Qiskit.  This file is distributed under the Apache 2.0 License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Deferred imports with import-time accounting."""
+
+import importlib
+import importlib.util
+import sys
+from timeit import default_timer
+
+# Seconds spent on each import done through `timed_import` in this process.
+_import_times = {}
+
+
+def timed_import(name, package=None):
+    """Imports a module and records how long the first import took."""
+    module = sys.modules.get(importlib.util.resolve_name(name, package))
+    if module is not None:
+        return module
+    start = default_timer()
+    module = importlib.import_module(name, package)
+    record_import_time(module.__name__, default_timer() - start)
+    return module
+
+
+def record_import_time(name, duration):
+    _import_times[name] = _import_times.get(name, 0.0) + duration
+
+
+def import_times():
+    return dict(_import_times)
+
+
+class LazyObject:
+    """An object that is only created the first time one of its attributes is used.
+
+    Pytest ids and reprs use the object name, so creating the parametrization
+    of a benchmark does not import the module that defines it.
+    """
+
+    def __init__(self, module, name, *args, **kwargs):
+        self._module = module
+        self._name = name
+        self._args = args
+        self._kwargs = kwargs
+        self._instance = None
+
+    def resolve(self):
+        if self._instance is None:
+            factory = getattr(timed_import(self._module), self._name)
+            self._instance = factory(*self._args, **self._kwargs)
+        return self._instance
+
+    def __getstate__(self):
+        # Only the recipe is pickled, the object is created again where it is used
+        return {**self.__dict__, "_instance": None}
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self):
+        return self._name
@@ -15,12 +15,15 @@ from red_queen.pawn import create_pawn
 class Knight:
     """The Knight is responsible for enlisting and managing the Pawn.
 
-    He keeps track of which jobs the Pawn is assigned and send commands.
+    He keeps track of which jobs the Pawn is assigned and send commands.  In a
+    thread scaling pass, his Pawns use ``threads`` threads on the ``cpus`` cores.
     """
 
-    def __init__(self, uid, config):
+    def __init__(self, uid, config, threads=None, cpus=None):
         self.uid = uid
         self.config = config
+        self.threads = threads
+        self.cpus = cpus
         self.shutdown_sent = False
         self.current_jobs = []
         if hasattr(self.config, "invocation_params"):
@@ -32,8 +35,11 @@ class Knight:
         self.enlist_pawn()
 
     def enlist_pawn(self) -> None:
+        self.shutdown_sent = False
         self.channel, pawn_channel = Pipe()
-        self.pawn = create_pawn(self.uid, self.option_dict, self.args, pawn_channel)
+        self.pawn = create_pawn(
+            self.uid, self.option_dict, self.args, pawn_channel, self.threads, self.cpus
+        )
 
     def new_jobs(self, indices):
         self.current_jobs.extend(indices)
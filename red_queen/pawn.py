@@ -5,12 +5,49 @@
 
 """Pawn module for running benchmarks."""
 
+import os
 import time
 from multiprocessing import get_context
+from timeit import default_timer
 
 import pytest
 from _pytest.config import Config, _prepareconfig
 from setproctitle import setproctitle
+from red_queen.imports import import_times
+
+
+# Parameters that, by default, identify the input of a benchmark.
+AFFINITY_PARAMS = ("qasm", "backend", "device", "coupling_map")
+
+# Environment variables that control how many threads the compilers use.  All
+# of them take a number, but QISKIT_PARALLEL, which takes TRUE or FALSE.
+THREAD_VARIABLES = [
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "RAYON_NUM_THREADS",
+    "QISKIT_PARALLEL",
+    "QISKIT_NUM_PROCS",
+]
+
+
+def affinity_key(item) -> str:
+    """Returns a key shared by the tests that use the same input.
+
+    The parameters making up the input can be chosen with the ``affinity``
+    marker, e.g. ``@pytest.mark.affinity("qasm")``, otherwise the ones named in
+    ``AFFINITY_PARAMS`` are used.  Tests without such parameters get a key of
+    their own.
+    """
+    callspec = getattr(item, "callspec", None)
+    if callspec is None:
+        return item.nodeid
+    marker = item.get_closest_marker("affinity")
+    names = marker.args if marker else AFFINITY_PARAMS
+    values = [f"{name}={callspec.params[name]}" for name in names if name in callspec.params]
+    if not values:
+        return item.nodeid
+    return f"{item.module.__name__}::{'|'.join(values)}"
 
 
 class Pawn:
@@ -27,6 +64,7 @@ class Pawn:
         self.processed_items = 0
         self.num_deselected = 0
         self.session = None
+        self.collect_times = {}
 
     def send_report(self, name, **kwargs):
         self.channel.send((self.uid, name, kwargs))
@@ -38,14 +76,28 @@ class Pawn:
     def pytest_collection(self, session):  # pylint: disable=unused-argument
         self.send_report("collection")
 
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_make_collect_report(self, collector):
+        # Collecting a module is dominated by importing it (and its imports)
+        if not isinstance(collector, pytest.Module):
+            yield
+            return
+        start = default_timer()
+        yield
+        self.collect_times[collector.nodeid] = default_timer() - start
+
     def pytest_deselected(self, items) -> None:
         self.num_deselected += len(items)
 
     def pytest_collection_finish(self, session):
+        affinity_keys = None
+        if self.config.getoption("schedule") == "affinity":
+            affinity_keys = [affinity_key(item) for item in session.items]
         self.send_report(
             "collection_finish",
             num_selected=len(session.items),
             num_deselected=self.num_deselected,
+            affinity_keys=affinity_keys,
         )
 
     def pytest_runtestloop(self, session):
@@ -96,10 +148,26 @@ class Pawn:
     def pytest_sessionfinish(self, exitstatus):  # pylint: disable=unused-argument
         # self.config.workeroutput["exitstatus"] = int(exitstatus)
         yield
+        self.send_report("import_times", collection=self.collect_times, imports=import_times())
         self.send_report("sessionfinish")
 
 
-def run_pawn(uid, option_dict, args, channel):
+def _limit_threads(threads, cpus):
+    """Makes the compilers use ``threads`` threads, pinned to the ``cpus`` cores.
+
+    This must happen before the compilers are imported, as some of them size
+    their thread pools once, when they load.
+    """
+    for name in THREAD_VARIABLES:
+        os.environ[name] = str(threads)
+    os.environ["QISKIT_PARALLEL"] = "TRUE" if threads > 1 else "FALSE"
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+
+
+def run_pawn(uid, option_dict, args, channel, threads=None, cpus=None):
+    if threads is not None:
+        _limit_threads(threads, cpus)
     if hasattr(Config, "InvocationParams"):
         config = _prepareconfig(args, None)
         option_dict["plugins"] = ["no:terminal"]
@@ -111,11 +179,12 @@ def run_pawn(uid, option_dict, args, channel):
     config = Config.fromdictargs(option_dict, args)
     config.option.num_pawns = None
     config.option.is_pawn = True
+    config.option.threads = threads
     config.pluginmanager.register(Pawn(uid, config, channel), "pawn")
     config.hook.pytest_cmdline_main(config=config)
 
 
-def create_pawn(uid, option_dict, args, channel):
+def create_pawn(uid, option_dict, args, channel, threads=None, cpus=None):
     return get_context("spawn").Process(
         name=f"pawn-{uid}",
         target=run_pawn,
@@ -124,5 +193,7 @@ def create_pawn(uid, option_dict, args, channel):
             option_dict,
             args,
             channel,
+            threads,
+            cpus,
         ),
     )
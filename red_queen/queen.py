@@ -9,7 +9,7 @@
 
 import pytest
 from red_queen.bishop import Bishop
-from red_queen.rook import Rook
+from red_queen.rook import Rook, available_cpus
 
 
 class RedQueen:
@@ -35,7 +35,17 @@ class RedQueen:
     @pytest.mark.trylast
     def pytest_sessionstart(self, session) -> None:
         num_pawns = self.config.getoption("num_pawns")
-        self.rook.start_session(session, num_pawns)
+        thread_counts = self.config.getoption("thread_scaling")
+        if thread_counts:
+            cpus = available_cpus()
+            if cpus is None:
+                raise pytest.UsageError("--thread_scaling needs to pin pawns to cores (Linux)")
+            if thread_counts[-1] > len(cpus):
+                raise pytest.UsageError(
+                    f"--thread_scaling can't give {thread_counts[-1]} cores of its own to a "
+                    f"pawn, out of the {len(cpus)} available"
+                )
+        self.rook.start_session(session, num_pawns, thread_counts[0] if thread_counts else None)
 
     def pytest_collection(self) -> bool:
         # The queen does not collect anything
@@ -43,6 +53,12 @@ class RedQueen:
 
     def pytest_runtestloop(self, session) -> bool:
         self.rook.run_tests()
+        # Thread scaling runs the tests once more for every other thread count
+        num_pawns = self.config.getoption("num_pawns")
+        for threads in (self.config.getoption("thread_scaling") or [])[1:]:
+            self.rook.start_session(session, num_pawns, threads)
+            self.rook.run_tests()
+        self.rook.run_quality_phase()
         self.bishop.store()
         return True
 
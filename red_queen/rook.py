@@ -6,12 +6,71 @@
 
 """Rook module for managing test session."""
 
+import os
 import random
+from collections import deque
 from itertools import cycle
+from multiprocessing import get_context
 from multiprocessing.connection import wait
 
 import psutil
 from red_queen import Knight
+from red_queen.fixtures import run_deferred_quality
+
+
+def available_cpus():
+    """Returns the cores this process may run on, or None if it can't pin Pawns to cores."""
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    return sorted(os.sched_getaffinity(0))
+
+
+class RandomQueue:
+    """Pending jobs handed out in a random (but reproducible) order."""
+
+    def __init__(self, num_jobs):
+        self.jobs = list(range(num_jobs))
+        random.seed(17)
+        random.shuffle(self.jobs)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def pop(self, knight):  # pylint: disable=unused-argument
+        return self.jobs.pop(0)
+
+
+class AffinityQueue:
+    """Pending jobs handed out so that jobs sharing a key go to the same Pawn.
+
+    Jobs are grouped by their affinity key.  A Knight keeps receiving jobs from
+    the group it claimed until it is exhausted, then claims the largest
+    unclaimed group.  When there are no groups left to claim, it steals from
+    the tail of the largest group claimed by another Knight.
+    """
+
+    def __init__(self, keys):
+        groups = {}
+        for index, key in enumerate(keys):
+            groups.setdefault(key, deque()).append(index)
+        self.unclaimed = deque(sorted(groups.values(), key=len, reverse=True))
+        self.claimed = {}
+        self.size = len(keys)
+
+    def __len__(self):
+        return self.size
+
+    def pop(self, knight):
+        self.size -= 1
+        group = self.claimed.get(knight.uid)
+        if group:
+            return group.popleft()
+        if self.unclaimed:
+            group = self.unclaimed.popleft()
+            self.claimed[knight.uid] = group
+            return group.popleft()
+        victim = max(self.claimed.values(), key=len)
+        return victim.pop()
 
 
 class Rook:
@@ -50,12 +109,34 @@ class Rook:
         self.num_jobs = None
 
         self.pending = None
+        # In cold mode every Pawn runs a single job and is then replaced
+        self.cold = config.getoption("cold")
         self.killed = []
         self.queue = []
+        # (benchmark index, payload) of quality work deferred by benchmarks
+        self.deferred_quality = []
 
-    def start_session(self, session, num_pawns: int) -> None:
+    def start_session(self, session, num_pawns: int, threads=None) -> None:
+        """Enlists the Knights and starts their Pawns.
+
+        With ``threads``, this is a thread scaling pass: every Pawn gets its own
+        set of ``threads`` cores, so there are at most as many Pawns as sets (the
+        Queen makes sure there is at least one).  The session can be started
+        again, once the previous one was run.
+        """
         self.session = session
-        self.knights = [Knight(uid, self.config) for uid in range(num_pawns)]
+        self.collecting = 0
+        self.done_collecting = 0
+        self.num_jobs = None
+        if threads is None:
+            self.knights = [Knight(uid, self.config) for uid in range(num_pawns)]
+        else:
+            cpus = available_cpus()
+            num_pawns = min(num_pawns, len(cpus) // threads)
+            self.knights = [
+                Knight(uid, self.config, threads, cpus[uid * threads : (uid + 1) * threads])
+                for uid in range(num_pawns)
+            ]
         self.channels = [knight.pawn_start() for knight in self.knights]
 
     def finish_session(self) -> None:
@@ -77,6 +158,27 @@ class Rook:
             self._monitor_memory()
         return True
 
+    def run_quality_phase(self) -> None:
+        """Runs the quality work benchmarks deferred, once every benchmark was timed.
+
+        The work runs in a pool of as many workers as there were Pawns, with no
+        timing going on, and its results are merged in the Bishop's report.
+        """
+        if not self.deferred_quality:
+            return
+        num_workers = max(1, min(len(self.knights), len(self.deferred_quality)))
+        total = len(self.deferred_quality)
+        with get_context("spawn").Pool(num_workers) as pool:
+            results = pool.starmap(
+                run_deferred_quality, [payload for _, payload in self.deferred_quality]
+            )
+        for (index, _), (stats, error) in zip(self.deferred_quality, results):
+            self.bishop.add_quality(index, stats, error)
+            if error is not None:
+                self.reporter.write_line(error, red=True)
+        self.reporter.write_line(f"Quality phase: {total} benchmarks", bold=True)
+        self.deferred_quality = []
+
     def kill_all(self) -> None:
         for knight in self.knights:
             knight.pawn_kill()
@@ -95,12 +197,15 @@ class Rook:
             knight.enlist_pawn()
             self.channels.append(knight.pawn_start())
 
-    def _set_num_jobs(self, num_jobs: int) -> None:
+    def _set_num_jobs(self, num_jobs: int, affinity_keys=None) -> None:
         if self.num_jobs is not None and num_jobs == self.num_jobs:
             return
         self.num_jobs = num_jobs
         self.session.testscollected = num_jobs
-        self.pending = list(range(num_jobs))
+        if affinity_keys is None:
+            self.pending = RandomQueue(num_jobs)
+        else:
+            self.pending = AffinityQueue(affinity_keys)
 
     def _assign_job(self, knight) -> None:
         """Try to assign a new job.
@@ -108,8 +213,8 @@ class Rook:
         If there is no job pending, send a shutdown notice.
         """
         if len(self.pending) > 0:
-            knight.new_jobs([self.pending.pop(0)])
-        if len(self.pending) == 0:
+            knight.new_jobs([self.pending.pop(knight)])
+        if len(self.pending) == 0 or self.cold:
             knight.pawn_shutdown()
 
     def _initial_assign(self) -> None:
@@ -117,12 +222,11 @@ class Rook:
 
         This function should only be called once!
         """
-        random.seed(17)
-        random.shuffle(self.pending)
-
         # If we don't have at least two tests per Pawn, we have to assigned them
         # all and send shutdown signals.
         initial_batch = min(len(self.pending), 2 * len(self.knights))
+        if self.cold:
+            initial_batch = min(len(self.pending), len(self.knights))
 
         # Assign tests round-robin up to the initial batch size
         knights = cycle(self.knights)
@@ -138,6 +242,9 @@ class Rook:
         pass
 
     def _knight_collection(self, knight):
+        if self.done_collecting >= len(self.knights):
+            # A replacement Pawn
+            return
         self.collecting += 1
         if self.collecting == 1:
             self.reporter.write(f"Collecting...{self.collecting}", flush=True, bold=True)
@@ -146,8 +253,8 @@ class Rook:
                 f"Collecting...{self.collecting}", flush=True, bold=True, erase=True
             )
 
-    def _knight_collection_finish(self, knight, num_selected, num_deselected):
-        self._set_num_jobs(num_selected)
+    def _knight_collection_finish(self, knight, num_selected, num_deselected, affinity_keys):
+        self._set_num_jobs(num_selected, affinity_keys)
         self.done_collecting += 1
         if self.done_collecting == len(self.knights):
             self._initial_assign()
@@ -175,11 +282,20 @@ class Rook:
 
     def _knight_runtest_protocol_complete(self, knight, item_index, duration):
         knight.ack_completed()
-        self._assign_job(knight)
+        if not self.cold:
+            self._assign_job(knight)
 
     def _knight_sessionfinish(self, knight):
         self.channels.remove(knight.channel)
         knight.shutdown()
+        if self.cold and self.pending:
+            knight.enlist_pawn()
+            self.channels.append(knight.pawn_start())
+
+    def _knight_benchmark_info(self, knight, info, deferred=None):
+        index = self.bishop.add_benchmark_info(info)
+        if deferred is not None:
+            self.deferred_quality.append((index, deferred))
 
-    def _knight_benchmark_info(self, knight, info):
-        self.bishop.add_benchmark_info(info)
+    def _knight_import_times(self, knight, collection, imports):
+        self.bishop.add_import_times(knight.uid, collection, imports)
@@ -0,0 +1,237 @@
+# ------------------------------------------------------------------------------
+# Part of Qiskit.  This file is distributed under the Apache 2.0 License.
+# See accompanying file /LICENSE for details.
+# ------------------------------------------------------------------------------
+
+"""Module to fit how the time and memory of tools scale with the size of their input.
+
+For every tool and algorithm, within a game, circuit family and device, the
+mean time is fitted to ``a * gates ** b`` and the peak memory to
+``c * qubits ** d``, by least squares in log space, over the benchmarks of a
+session.  A tool whose exponent grows between sessions scales worse than it
+used to, which matters more at scale than any constant factor.
+"""
+
+import argparse
+import pathlib
+import re
+from collections import defaultdict
+from math import exp, log
+from statistics import fmean
+
+from rich.console import Console
+from rich.table import Table
+
+from .console_tables import check_environments
+from .loader import load_benchmarks
+
+# The size field and the measurement each model fits
+MODELS = {
+    "time": ("gates", lambda benchmark: benchmark["stats"]["timing"]["mean"]),
+    "memory": ("qubits", lambda benchmark: benchmark["stats"].get("memory", {}).get("peak")),
+}
+
+# Fewer distinct sizes than this don't make a fit
+MIN_SIZES = 3
+
+
+def _least_squares(xs, ys):
+    """Returns the slope and intercept of the line fitting the points best."""
+    mean_x = fmean(xs)
+    mean_y = fmean(ys)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum(
+        (x - mean_x) ** 2 for x in xs
+    )
+    return slope, mean_y - slope * mean_x
+
+
+def fit_power_law(sizes, values):
+    """Returns ``(coefficient, exponent)`` of ``value = coefficient * size ** exponent``.
+
+    Points that can't be put in log space (zero or missing) are ignored.
+    Returns None if there are fewer than ``MIN_SIZES`` distinct sizes left.
+    """
+    points = [
+        (size, value)
+        for size, value in zip(sizes, values)
+        if size and value is not None and value > 0
+    ]
+    if len({size for size, _ in points}) < MIN_SIZES:
+        return None
+    slope, intercept = _least_squares(
+        [log(size) for size, _ in points], [log(value) for _, value in points]
+    )
+    return exp(intercept), slope
+
+
+# A size at the end of a benchmark name, e.g. "(16 qubits)" or ", 15 bits)"
+_SIZE_SUFFIX = re.compile(r"(?: \(|, )\d+ \w+\)$")
+
+
+def _family(name):
+    """Returns a benchmark name without its size, or None if it has no size.
+
+    "Bernstein Vazirani (mid-circuit measurement, 15 bits)" belongs to the
+    "Bernstein Vazirani (mid-circuit measurement)" family.  Mapping benchmarks
+    are named after their circuit files, which aren't sizes of one family.
+    """
+    match = _SIZE_SUFFIX.search(name)
+    if match is None:
+        return None
+    family = name[: match.start()]
+    return f"{family})" if match.group().startswith(",") else family
+
+
+def _series_key(benchmark):
+    """Returns the (game, family, device, tool, algorithm) of a benchmark's series.
+
+    Only benchmarks of the same game, circuit family and device differ by their
+    input alone: e.g. the scaling game maps the same circuits on ever larger
+    devices, while the application games build one circuit family per size.
+    """
+    game = pathlib.PurePosixPath(benchmark["id"].split("::")[0]).stem
+    return (
+        game,
+        _family(benchmark["name"]),
+        benchmark["size"].get("device"),
+        benchmark["tool"],
+        benchmark["algorithm"],
+    )
+
+
+def fit_sessions(benchmarks):
+    """Fits every model per session and series (see `_series_key`).
+
+    Returns ``{series: {storage: {model: (coefficient, exponent, points)}}}``, with
+    the storages in the order their benchmarks were loaded.
+    """
+    series = defaultdict(lambda: defaultdict(list))
+    for benchmark in benchmarks:
+        if not benchmark.get("size") or not benchmark.get("valid", True):
+            continue
+        series[_series_key(benchmark)][benchmark["storage"]].append(benchmark)
+
+    fits = {}
+    for key, sessions in series.items():
+        fits[key] = {}
+        for storage, points in sessions.items():
+            fits[key][storage] = {}
+            for model, (field, measure) in MODELS.items():
+                fit = fit_power_law(
+                    [point["size"].get(field) for point in points],
+                    [measure(point) for point in points],
+                )
+                if fit is not None:
+                    fits[key][storage][model] = fit + (len(points),)
+    return fits
+
+
+def exponent_growth(fits, tolerance):
+    """Lists the exponents that grew by more than ``tolerance`` since the previous session.
+
+    Every entry is a ``(series, model, storage, previous, exponent)`` tuple.
+    """
+    growth = []
+    for key, sessions in fits.items():
+        for model in MODELS:
+            previous = None
+            for storage, models in sessions.items():
+                if model not in models:
+                    continue
+                exponent = models[model][1]
+                if previous is not None and exponent - previous > tolerance:
+                    growth.append((key, model, storage, previous, exponent))
+                previous = exponent
+    return growth
+
+
+def _series_columns(key):
+    game, family, device, tool, algorithm = key
+    game = f"{game}: {family}" if family else game
+    return game, str(device or ""), f"{tool} ({algorithm})"
+
+
+def complexity_table(fits, growth, console):
+    grown = {(key, model, storage) for key, model, storage, *_ in growth}
+    table = Table(title="Complexity: time ~ a * gates^b, memory ~ c * qubits^d")
+    table.add_column("Game")
+    table.add_column("Device")
+    table.add_column("Name")
+    table.add_column("Storage")
+    table.add_column("b")
+    table.add_column("a")
+    table.add_column("d")
+    table.add_column("c")
+    table.add_column("Benchmarks")
+    for key, sessions in sorted(fits.items(), key=lambda item: _series_columns(item[0])):
+        for storage, models in sessions.items():
+            if not models:
+                continue
+            row = []
+            for model in MODELS:
+                if model not in models:
+                    row.extend(["", ""])
+                    continue
+                coefficient, exponent, _ = models[model]
+                if (key, model, storage) in grown:
+                    row.append(f"[bold red]{exponent:.3g}[/bold red]")
+                else:
+                    row.append(f"{exponent:.3g}")
+                row.append(f"{coefficient:.3g}")
+            points = max(fit[2] for fit in models.values())
+            table.add_row(*_series_columns(key), str(storage or ""), *row, str(points))
+    console.print("\n", table)
+
+
+def growth_table(growth, console):
+    table = Table(title="[bold red]Exponents that grew[/bold red]")
+    table.add_column("Game")
+    table.add_column("Device")
+    table.add_column("Name")
+    table.add_column("Model")
+    table.add_column("Storage")
+    table.add_column("Previous")
+    table.add_column("Exponent")
+    for key, model, storage, previous, exponent in growth:
+        table.add_row(
+            *_series_columns(key), model, str(storage), f"{previous:.3g}", f"{exponent:.3g}"
+        )
+    console.print("\n", table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Complexity fitting reporter.")
+    parser.add_argument(
+        "--storage",
+        default="./results",
+        metavar="<storage>",
+        type=pathlib.Path,
+        help="A result file, or a directory of them (one per session)",
+    )
+    parser.add_argument("--tool", default=None, help="Filter the results by tool")
+    parser.add_argument(
+        "--tolerance",
+        default=0.1,
+        type=float,
+        help="How much an exponent may grow between sessions before it is flagged",
+    )
+    parser.add_argument(
+        "--allow-mixed-environments",
+        action="store_true",
+        default=False,
+        help="Compare sessions even if their environment fingerprints differ",
+    )
+    args = parser.parse_args()
+    benchmarks = list(load_benchmarks(args.storage, args.tool))
+    console = Console()
+    # An exponent that changes with the environment is no regression
+    check_environments(benchmarks, console, args.allow_mixed_environments)
+    fits = fit_sessions(benchmarks)
+    growth = exponent_growth(fits, args.tolerance)
+    complexity_table(fits, growth, console)
+    if growth:
+        growth_table(growth, console)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,9 @@
 
 
 import argparse
+import json
 import pathlib
+import sys
 from collections import defaultdict
 from math import isinf
 from statistics import geometric_mean
@@ -15,7 +17,14 @@ from statistics import geometric_mean
 from rich.console import Console
 from rich.table import Table
 
-from .loader import group_benchmarks, load_benchmarks
+from .loader import (
+    environment_mismatches,
+    group_benchmarks,
+    load_benchmarks,
+    load_ensembles,
+    load_import_times,
+    load_thread_scaling,
+)
 
 
 class NameFormarter:
@@ -61,6 +70,9 @@ def formatted_normalize(baseline, value):
 
 
 def format_entry(stats, metric, best, worst):
+    # Missing, e.g. its computation failed
+    if stats.get(metric) is None:
+        return ""
     prefix = ""
     suffix = ""
     if stats[metric] == worst[metric]:
@@ -73,21 +85,33 @@ def format_entry(stats, metric, best, worst):
     return f"{prefix}{stats[metric]:.4g}{norm}{suffix}"
 
 
+def _quality_metrics(benchmarks):
+    """Returns the quality metrics of any of the benchmarks, in order of appearance."""
+    metrics = {}
+    for benchmark in benchmarks:
+        metrics.update(dict.fromkeys(benchmark["stats"]["quality"]))
+    return list(metrics)
+
+
 def benchmark_table(name, benchmarks, name_format, console):
     table = Table(title=f"Benchmark: {name}")
     table.add_column("Name")
     table.add_column("Min")
     table.add_column("Max")
     table.add_column("Mean")
-    for key, _ in benchmarks[0]["stats"]["quality"].items():
+    metrics = _quality_metrics(benchmarks)
+    for key in metrics:
         table.add_column(key)
 
     best = {}
     worst = {}
-    for kind in ["timing", "quality"]:
-        for metric in benchmarks[0]["stats"][kind].keys():
-            worst[metric] = max([benchmark["stats"][kind][metric] for benchmark in benchmarks])
-            best[metric] = min([benchmark["stats"][kind][metric] for benchmark in benchmarks])
+    for kind, kind_metrics in [("timing", benchmarks[0]["stats"]["timing"]), ("quality", metrics)]:
+        for metric in kind_metrics:
+            values = [benchmark["stats"][kind].get(metric) for benchmark in benchmarks]
+            values = [value for value in values if value is not None]
+            if values:
+                worst[metric] = max(values)
+                best[metric] = min(values)
 
     for benchmark in benchmarks:
         timing = benchmark["stats"]["timing"]
@@ -96,7 +120,7 @@ def benchmark_table(name, benchmarks, name_format, console):
         max_str = format_entry(timing, "max", best, worst)
         mean_str = format_entry(timing, "mean", best, worst)
         quality_str = []
-        for key, _ in quality.items():
+        for key in metrics:
             quality_str.append(format_entry(quality, key, best, worst))
         table.add_row(name_format(benchmark), min_str, max_str, mean_str, *quality_str)
     console.print("\n", table)
@@ -121,10 +145,318 @@ def aggregate_results(aggregate, benchmarks, name_format):
         data["mean"].append(normalize(baselines["timing"], benchmark["stats"]["timing"]["mean"]))
         if not skip_quality:
             for key, value in benchmark["stats"]["quality"].items():
+                # Metrics missing from the baseline or this benchmark can't be compared
+                if value is None or baselines.get(key) is None:
+                    continue
                 data[key].append(normalize(baselines[key], value))
         aggregate[benchmark["name"]] = data
 
 
+def optimality_table(benchmarks, name_format, console):
+    """Ranks tools by how close they get to the optimal depth per unit of compile time.
+
+    Only benchmarks with a known optimal depth (e.g. QUEKO circuits) are used.
+    """
+    series = defaultdict(lambda: ([], []))
+    for benchmark in benchmarks:
+        depth_ratio = benchmark["stats"]["quality"].get("depth_ratio")
+        if depth_ratio is None:
+            continue
+        ratios, times = series[name_format(benchmark)]
+        ratios.append(depth_ratio)
+        times.append(benchmark["stats"]["timing"]["mean"])
+    if not series:
+        return
+
+    rows = []
+    for row_name, (ratios, times) in series.items():
+        ratio = geometric_mean(ratios)
+        time = geometric_mean(times)
+        rows.append((ratio * time, row_name, ratio, time, len(ratios)))
+    rows.sort()
+
+    table = Table(title="Optimality")
+    table.add_column("Name")
+    table.add_column("Depth ratio")
+    table.add_column("Mean")
+    table.add_column("Ratio x Mean")
+    table.add_column("Circuits")
+    for score, row_name, ratio, time, count in rows:
+        table.add_row(row_name, f"{ratio:.4g}", f"{time:.4g}", f"{score:.4g}", str(count))
+    console.print("\n", table)
+
+
+def _dominates(point, other):
+    return all(a <= b for a, b in zip(point, other)) and point != other
+
+
+def pareto_tables(benchmarks, console):
+    """Shows the (time, cx, depth) points of effort sweeps and marks the Pareto front.
+
+    There is one table per benchmark, tool and storage, with a row per setting:
+    sweeps of different sessions are not compared with each other.
+    """
+    sweeps = defaultdict(list)
+    for benchmark in benchmarks:
+        if "effort" in benchmark.get("parameters", {}):
+            sweeps[(benchmark["name"], benchmark["tool"], benchmark["storage"])].append(benchmark)
+
+    for (name, tool, storage), points in sweeps.items():
+        metrics = []
+        for benchmark in points:
+            quality = benchmark["stats"]["quality"]
+            metrics.append(
+                (
+                    benchmark["stats"]["timing"]["mean"],
+                    quality.get("cx", 0),
+                    quality.get("depth", 0),
+                )
+            )
+        title = f"Pareto: {name} ({tool})"
+        if storage:
+            title = f"{title} ({storage:.4s})"
+        table = Table(title=title)
+        table.add_column("Algorithm")
+        table.add_column("Mean")
+        table.add_column("cx")
+        table.add_column("depth")
+        table.add_column("Front")
+        for metric, benchmark in sorted(zip(metrics, points), key=lambda point: point[0]):
+            front = not any(_dominates(other, metric) for other in metrics)
+            algorithm = benchmark["algorithm"]
+            if "seed" in benchmark["parameters"]:
+                algorithm = f"{algorithm} (seed {benchmark['parameters']['seed']})"
+            table.add_row(
+                algorithm,
+                f"{metric[0]:.4g}",
+                str(metric[1]),
+                str(metric[2]),
+                "[green]*[/green]" if front else "",
+            )
+        console.print("\n", table)
+
+
+def throughput_table(benchmarks, console):
+    """Compares batches transpiled serially with the same batches transpiled in parallel.
+
+    The parallel efficiency is the speedup over the serial run divided by the
+    number of processes qiskit used for the parallel run.
+    """
+    batches = defaultdict(dict)
+    for benchmark in benchmarks:
+        parameters = dict(benchmark.get("parameters", {}))
+        if "batch" not in parameters:
+            continue
+        mode = parameters.pop("mode")
+        workers = parameters.pop("workers")
+        key = (benchmark["name"], benchmark["tool"], benchmark["storage"])
+        batches[key + (json.dumps(parameters, sort_keys=True),)][mode] = (benchmark, workers)
+    if not batches:
+        return
+
+    table = Table(title="Batch throughput (circuits/s)")
+    table.add_column("Benchmark")
+    table.add_column("Name")
+    table.add_column("Serial")
+    table.add_column("Parallel")
+    table.add_column("Workers")
+    table.add_column("Speedup")
+    table.add_column("Efficiency")
+    for (name, tool, storage, parameters), modes in sorted(batches.items()):
+        parameters = json.loads(parameters)
+        row_name = (
+            f"{tool} (Optimization level: {parameters['optimization_level']}"
+            f" on {parameters['backend']})"
+        )
+        if storage:
+            row_name = f"{row_name} ({storage:.4s})"
+        row = []
+        for mode in ("serial", "parallel"):
+            if mode in modes:
+                mean = modes[mode][0]["stats"]["timing"]["mean"]
+                row.append(f"{parameters['batch'] / mean:.4g}")
+            else:
+                row.append("")
+        if "serial" in modes and "parallel" in modes:
+            (serial, _), (parallel, workers) = modes["serial"], modes["parallel"]
+            speedup = serial["stats"]["timing"]["mean"] / parallel["stats"]["timing"]["mean"]
+            row.extend([str(workers), f"{speedup:.3g}", f"{speedup / workers:.1%}"])
+        else:
+            row.extend(["", "", ""])
+        table.add_row(name, row_name, *row)
+    console.print("\n", table)
+
+
+def _spread(stats):
+    if stats is None:
+        return ""
+    return f"{stats['median']:.4g} ({stats['p25']:.4g} - {stats['p75']:.4g})"
+
+
+def ensembles_table(storage, tool, console):
+    """Shows the distribution of results of benchmarks run over several seeds.
+
+    Distributions are over the valid seeds only, the others are counted apart.
+    """
+    ensembles = list(load_ensembles(storage, tool))
+    if not ensembles:
+        return
+    table = Table(title="Seed ensembles: median (p25 - p75)")
+    table.add_column("Benchmark")
+    table.add_column("Name")
+    table.add_column("Seeds")
+    table.add_column("Mean")
+    table.add_column("Quality")
+    for row_storage, ensemble in ensembles:
+        name = f"{ensemble['tool']} ({ensemble['algorithm']})"
+        if row_storage:
+            name = f"{name} ({row_storage:.4s})"
+        quality = ", ".join(
+            f"{metric}: {_spread(stats)}" for metric, stats in ensemble["quality"].items()
+        )
+        seeds = str(len(ensemble["seeds"]))
+        if ensemble.get("invalid"):
+            seeds = f"{seeds} ({ensemble['invalid']} invalid)"
+        table.add_row(
+            ensemble["name"],
+            name,
+            seeds,
+            _spread(ensemble["timing"]),
+            quality,
+        )
+    console.print("\n", table)
+
+
+def thread_scaling_table(storage, tool, console):
+    """Shows the speedup and efficiency of benchmarks run over several thread counts."""
+    curves = list(load_thread_scaling(storage, tool))
+    if not curves:
+        return
+    table = Table(title="Thread scaling: speedup (efficiency)")
+    table.add_column("Benchmark")
+    table.add_column("Name")
+    table.add_column("Threads")
+    table.add_column("Mean")
+    table.add_column("Speedup")
+    for row_storage, curve in curves:
+        name = f"{curve['tool']} ({curve['algorithm']})"
+        if row_storage:
+            name = f"{name} ({row_storage:.4s})"
+        table.add_row(
+            curve["id"],
+            name,
+            ", ".join(str(threads) for threads in curve["threads"]),
+            ", ".join(f"{mean:.4g}" for mean in curve["mean"]),
+            ", ".join(
+                f"{speedup:.3g} ({efficiency:.0%})"
+                for speedup, efficiency in zip(curve["speedup"], curve["efficiency"])
+            ),
+        )
+    console.print("\n", table)
+
+
+def phases_table(benchmarks, name_format, console):
+    """Shows the mean time each benchmark spent in every phase."""
+    benchmarks = [benchmark for benchmark in benchmarks if "phases" in benchmark["stats"]]
+    if not benchmarks:
+        return
+    phases = []
+    for benchmark in benchmarks:
+        for phase in benchmark["stats"]["phases"]:
+            if phase not in phases:
+                phases.append(phase)
+
+    table = Table(title="Phases")
+    table.add_column("Benchmark")
+    table.add_column("Name")
+    for phase in phases:
+        table.add_column(phase)
+    for benchmark in sorted(benchmarks, key=lambda benchmark: benchmark["name"]):
+        durations = benchmark["stats"]["phases"]
+        row = [f"{durations[phase]:.4g}" if phase in durations else "" for phase in phases]
+        table.add_row(benchmark["name"], name_format(benchmark), *row)
+    console.print("\n", table)
+
+
+def latency_table(benchmarks, name_format, console):
+    """Shows each benchmark's first call next to its warm mean.
+
+    A first call is cold if it was the first benchmark run by its pawn (every
+    one of them, in a session run with ``--cold``).
+    """
+    benchmarks = [benchmark for benchmark in benchmarks if "latency" in benchmark["stats"]]
+    if not benchmarks:
+        return
+    table = Table(title="Latency")
+    table.add_column("Benchmark")
+    table.add_column("Name")
+    table.add_column("First call")
+    table.add_column("Cold")
+    table.add_column("Warm mean")
+    table.add_column("First / Warm")
+    for benchmark in sorted(benchmarks, key=lambda benchmark: benchmark["name"]):
+        first_call = benchmark["stats"]["latency"]["first_call"]
+        warm = benchmark["stats"]["timing"]["mean"]
+        table.add_row(
+            benchmark["name"],
+            name_format(benchmark),
+            f"{first_call:.4g}",
+            "yes" if benchmark["stats"]["latency"]["cold"] else "",
+            f"{warm:.4g}",
+            f"{first_call / warm:.3g}",
+        )
+    console.print("\n", table)
+
+
+def import_times_table(storage, console):
+    table = Table(title="Import times")
+    table.add_column("Storage")
+    table.add_column("Pawn")
+    table.add_column("Kind")
+    table.add_column("Module")
+    table.add_column("Seconds")
+    rows = sorted(load_import_times(storage), key=lambda row: (str(row[0]), row[1], -row[4]))
+    for row_storage, pawn, kind, module, seconds in rows:
+        table.add_row(str(row_storage or ""), pawn, kind, module, f"{seconds:.4g}")
+    console.print("\n", table)
+
+
+def exclude_invalid(benchmarks, console):
+    """Lists the results whose output failed verification and returns the others."""
+    invalid = [benchmark for benchmark in benchmarks if not benchmark.get("valid", True)]
+    if not invalid:
+        return benchmarks
+    table = Table(title="[bold red]Invalid results (excluded)[/bold red]")
+    table.add_column("Benchmark")
+    table.add_column("Storage")
+    for benchmark in invalid:
+        table.add_row(benchmark["id"], str(benchmark["storage"] or ""))
+    console.print("\n", table)
+    return [benchmark for benchmark in benchmarks if benchmark.get("valid", True)]
+
+
+def check_environments(benchmarks, console, allow_mixed):
+    """Refuses to compare timings taken under different environments."""
+    mismatches = environment_mismatches(benchmarks)
+    if not mismatches:
+        return
+    table = Table(title="[bold red]Incompatible environments[/bold red]")
+    table.add_column("Field")
+    table.add_column("Storage")
+    table.add_column("Value")
+    for field, values in mismatches.items():
+        for storage, value in values.items():
+            table.add_row(field, str(storage), str(value))
+    console.print("\n", table)
+    if not allow_mixed:
+        console.print(
+            "[bold red]Refusing to compare timings from incompatible environments. "
+            "Use --allow-mixed-environments to compare them anyway.[/bold red]"
+        )
+        sys.exit(1)
+    console.print("[bold red]WARNING: comparing timings from incompatible environments![/bold red]")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Console tables reporter.")
     parser.add_argument(
@@ -135,11 +467,48 @@ def main():
         help="",
     )
     parser.add_argument("--tool", default=None, help="Filter the results by tool")
+    parser.add_argument(
+        "--allow-mixed-environments",
+        action="store_true",
+        default=False,
+        help="Compare results even if their environment fingerprints differ",
+    )
+    parser.add_argument(
+        "--phases",
+        action="store_true",
+        default=False,
+        help="Show how long each benchmark spent parsing, in layout and in routing",
+    )
+    parser.add_argument(
+        "--latency",
+        action="store_true",
+        default=False,
+        help="Show the first (cold) call of each benchmark next to its warm mean",
+    )
+    parser.add_argument(
+        "--import-times",
+        action="store_true",
+        default=False,
+        help="Show how long each pawn spent importing modules",
+    )
     args = parser.parse_args()
-    benchmarks = load_benchmarks(args.storage, args.tool)
+    benchmarks = list(load_benchmarks(args.storage, args.tool))
+    console = Console()
+    if args.import_times:
+        import_times_table(args.storage, console)
+    check_environments(benchmarks, console, args.allow_mixed_environments)
+    benchmarks = exclude_invalid(benchmarks, console)
     groups = group_benchmarks(benchmarks, group_by="name")
     name_format = NameFormarter(group_by="name")
-    console = Console()
+    optimality_table(benchmarks, name_format, console)
+    pareto_tables(benchmarks, console)
+    throughput_table(benchmarks, console)
+    ensembles_table(args.storage, args.tool, console)
+    thread_scaling_table(args.storage, args.tool, console)
+    if args.phases:
+        phases_table(benchmarks, name_format, console)
+    if args.latency:
+        latency_table(benchmarks, name_format, console)
     aggregate = {}
     for group, benchmarks in groups:
         benchmark_table(group, benchmarks, name_format, console)
@@ -9,30 +9,89 @@ import json
 from collections import defaultdict
 
 
-def load_benchmarks(dir_or_file, filter_by=None):
+def _result_files(dir_or_file):
     if dir_or_file.is_file():
-        data = json.loads(dir_or_file.read_text(encoding="utf8"))
+        yield None, json.loads(dir_or_file.read_text(encoding="utf8"))
+        return
+    paths = list(dir_or_file.glob("**/*.json"))
+    paths.sort(key=lambda path: (path.name, path.parent))
+    for path in paths:
+        if not path.is_file():
+            continue
+        try:
+            data = json.loads(path.read_text(encoding="utf8"))
+        except Exception:  # pylint: disable=broad-except
+            print(f"Failed to load JSON file: {path}")
+            continue
+        yield path.name, data
+
+
+def load_import_times(dir_or_file):
+    """Yields ``(storage, pawn, kind, module, seconds)`` for every recorded import."""
+    for storage, data in _result_files(dir_or_file):
+        for pawn, times in data.get("import_times", {}).items():
+            for kind, modules in times.items():
+                for module, seconds in modules.items():
+                    yield storage, pawn, kind, module, seconds
+
+
+def load_ensembles(dir_or_file, filter_by=None):
+    """Yields ``(storage, ensemble)`` for every benchmark run over several seeds."""
+    for storage, data in _result_files(dir_or_file):
+        for ensemble in data.get("ensembles", []):
+            if filter_by and ensemble["tool"] != filter_by:
+                continue
+            yield storage, ensemble
+
+
+def load_thread_scaling(dir_or_file, filter_by=None):
+    """Yields ``(storage, curve)`` for every benchmark run over several thread counts."""
+    for storage, data in _result_files(dir_or_file):
+        for curve in data.get("thread_scaling", []):
+            if filter_by and curve["tool"] != filter_by:
+                continue
+            yield storage, curve
+
+
+def load_benchmarks(dir_or_file, filter_by=None):
+    for storage, data in _result_files(dir_or_file):
         for benchmark in data["benchmarks"]:
             if filter_by and benchmark["tool"] != filter_by:
                 continue
-            benchmark["storage"] = None
+            benchmark["storage"] = storage
+            benchmark["environment"] = data.get("environment")
             yield benchmark
-    else:
-        paths = list(dir_or_file.glob("**/*.json"))
-        paths.sort(key=lambda path: (path.name, path.parent))
-        for path in paths:
-            if not path.is_file():
-                continue
-            try:
-                data = json.loads(path.read_text(encoding="utf8"))
-            except Exception:  # pylint: disable=broad-except
-                print(f"Failed to load JSON file: {path}")
-                continue
-            for benchmark in data["benchmarks"]:
-                if filter_by and benchmark["tool"] != filter_by:
-                    continue
-                benchmark["storage"] = path.name
-                yield benchmark
+
+
+def environment_mismatches(benchmarks):
+    """Returns the environment fields that differ between storages.
+
+    The result maps each differing field to the values seen per storage. Result
+    files written before environments were recorded are reported under the
+    ``fingerprint`` field with a ``None`` value.
+    """
+    environments = {}
+    for benchmark in benchmarks:
+        environments.setdefault(benchmark["storage"], benchmark.get("environment") or {})
+    if len(environments) <= 1:
+        return {}
+    fingerprints = {env.get("fingerprint") for env in environments.values()}
+    if len(fingerprints) == 1 and None not in fingerprints:
+        return {}
+
+    mismatches = {}
+    fields = set()
+    for env in environments.values():
+        fields.update(key for key in env if key not in ("fingerprint", "red_queen"))
+    for field in sorted(fields):
+        values = {storage: env.get(field) for storage, env in environments.items()}
+        if len({json.dumps(value, sort_keys=True) for value in values.values()}) > 1:
+            mismatches[field] = values
+    if not mismatches:
+        mismatches["fingerprint"] = {
+            storage: env.get("fingerprint") for storage, env in environments.items()
+        }
+    return mismatches
 
 
 def group_benchmarks(benchmarks, group_by):